@@ -1,4 +1,3 @@
-import json
 import logging
 import asyncio
 from typing import Dict, Type, Any, Optional, List, Tuple, Union, Callable
@@ -6,6 +5,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 import hashlib
 
+import orjson
 from pydantic import BaseModel, Field
 from fastapi import HTTPException, status
 from redis import asyncio as aioredis
@@ -22,6 +22,7 @@ from .hr_agent import HRAgent
 from .dev_agent import DevelopmentAgent
 from .design_agent import DesignAgent
 from ..core.config import settings
+from ...utils.time import utcnow
 from ..workflow.workflow_manager import Workflow, BaseWorkflowStep, WorkflowContext
 
 # Import integrations
@@ -43,7 +44,7 @@ class AgentMetrics(BaseModel):
     successful_requests: int = 0
     failed_requests: int = 0
     average_response_time: float = 0.0
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=utcnow)
     error_rate: float = 0.0
 
 class AgentFactory:
@@ -365,36 +366,51 @@ class AgentFactory:
             )
         return agent
     
+    def _serialize_agent_state(self, agent: BaseAgent) -> Tuple[str, bytes]:
+        """Build the Redis key and JSON payload for an agent's state."""
+        state = {
+            "agent_id": agent.config.id,
+            "agent_type": agent.__class__.__name__.lower().replace("agent", ""),
+            "state": agent.state.value if hasattr(agent, 'state') else AgentState.IDLE.value,
+            "metrics": agent.metrics if hasattr(agent, 'metrics') else {},
+            "config": agent.config.model_dump(exclude={"llm_config"}),
+            "last_updated": utcnow().isoformat(),
+            "version": "1.0"
+        }
+        
+        instance_key = f"{state['agent_type']}:{agent.config.id}"
+        return f"agent:{instance_key}", orjson.dumps(state, default=str, option=orjson.OPT_NON_STR_KEYS)
+    
     async def save_agent_state(self, agent: BaseAgent) -> bool:
         """Save the current state of an agent to persistent storage."""
-        try:
-            if not self._redis:
-                return False
-                
-            state = {
-                "agent_id": agent.config.id,
-                "agent_type": agent.__class__.__name__.lower().replace("agent", ""),
-                "state": agent.state.value if hasattr(agent, 'state') else AgentState.IDLE.value,
-                "metrics": agent.metrics if hasattr(agent, 'metrics') else {},
-                "config": agent.config.dict(exclude={"llm_config"}),
-                "last_updated": datetime.utcnow().isoformat(),
-                "version": "1.0"
-            }
+        return await self.save_agent_states([agent]) == 1
+    
+    async def save_agent_states(self, agents: List[BaseAgent]) -> int:
+        """
+        Save the state of several agents in a single Redis round trip.
+        
+        Args:
+            agents: Agents whose state should be persisted
             
-            instance_key = f"{state['agent_type']}:{agent.config.id}"
+        Returns:
+            int: Number of agent states written
+        """
+        try:
+            if not self._redis or not agents:
+                return 0
             
-            # Save to Redis with TTL of 7 days
-            await self._redis.set(
-                f"agent:{instance_key}",
-                json.dumps(state, default=str),
-                ex=timedelta(days=7)
-            )
+            # Queue every write on one pipeline, TTL of 7 days
+            pipe = self._redis.pipeline(transaction=False)
+            for agent in agents:
+                key, payload = self._serialize_agent_state(agent)
+                pipe.set(key, payload, ex=timedelta(days=7))
             
-            return True
+            results = await pipe.execute()
+            return sum(1 for result in results if result)
             
         except Exception as e:
             logger.error(f"Error saving agent state: {str(e)}", exc_info=True)
-            return False
+            return 0
     
     async def _load_agent_state(self, instance_key: str) -> Optional[Dict]:
         """Load agent state from persistent storage."""
@@ -406,7 +422,7 @@ class AgentFactory:
             if not state_data:
                 return None
                 
-            state = json.loads(state_data)
+            state = orjson.loads(state_data)
             
             # Convert string timestamps back to datetime objects
             for time_field in ["last_updated"]:
@@ -436,27 +452,34 @@ class AgentFactory:
     
     async def get_all_agents(self) -> List[Dict[str, Any]]:
         """Get information about all active agents."""
+        instances = list(self._agent_instances.items())
+        
+        # Agents report state independently, so collect them concurrently
+        states = await asyncio.gather(
+            *(agent.get_state() for _, agent in instances),
+            return_exceptions=True
+        )
+        
         agents = []
-        for instance_key, agent in self._agent_instances.items():
-            try:
-                state = await agent.get_state()
-                agents.append({
-                    "id": agent.config.id,
-                    "type": agent.__class__.__name__.lower().replace("agent", ""),
-                    "name": agent.config.name,
-                    "state": state,
-                    "last_updated": datetime.utcnow().isoformat()
-                })
-            except Exception as e:
-                logger.error(f"Error getting state for agent {instance_key}: {str(e)}")
+        last_updated = utcnow().isoformat()
+        for (instance_key, agent), state in zip(instances, states):
+            if isinstance(state, Exception):
+                logger.error(f"Error getting state for agent {instance_key}: {str(state)}")
+                continue
+            agents.append({
+                "id": agent.config.id,
+                "type": agent.__class__.__name__.lower().replace("agent", ""),
+                "name": agent.config.name,
+                "state": state,
+                "last_updated": last_updated
+            })
         
         return agents
     
     async def clear_agents(self) -> None:
         """Clear all agent instances from memory."""
         # Save states before clearing
-        for agent in self._agent_instances.values():
-            await self.save_agent_state(agent)
+        await self.save_agent_states(list(self._agent_instances.values()))
         
         self._agent_instances.clear()
         logger.info("Cleared all agent instances from memory")
@@ -473,7 +496,7 @@ class AgentFactory:
         
         return {
             "status": "ok",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utcnow().isoformat(),
             "agents_registered": len(self._agent_registry),
             "agents_active": len(self._agent_instances),
             "redis_connected": redis_ok,
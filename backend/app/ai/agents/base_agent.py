@@ -131,7 +131,7 @@ class BaseAgent(ABC):
             "state": self.state,
             "metrics": self.metrics,
             "last_error": str(self.last_error) if self.last_error else None,
-            "config": self.config.dict(exclude={"llm_config"}),
+            "config": self.config.model_dump(exclude={"llm_config"}),
             "llm_config_available": bool(self.config.llm_config)
         }
     
@@ -2,8 +2,9 @@
 Pydantic models for agent configuration and state management.
 """
 from enum import Enum
+import time
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentRole(str, Enum):
@@ -29,8 +30,8 @@ class AgentConfig(BaseModel):
     llm_config: Dict[str, Any] = Field(default_factory=dict, description="LLM configuration")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "market_researcher_1",
                 "role": "Market Research Analyst",
@@ -42,6 +43,7 @@ class AgentConfig(BaseModel):
                 "max_iter": 10
             }
         }
+    )
 
 
 class AgentState(BaseModel):
@@ -51,7 +53,7 @@ class AgentState(BaseModel):
     memory: Dict[str, Any] = Field(default_factory=dict)
     context: Dict[str, Any] = Field(default_factory=dict)
     metrics: Dict[str, Any] = Field(default_factory=dict)
-    last_updated: float = Field(default_factory=lambda: time.time())
+    last_updated: float = Field(default_factory=time.time)
 
 
 class CrewConfig(BaseModel):
@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Any, Type, TypeVar
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 import logging
 import uuid
@@ -8,6 +8,7 @@ from enum import Enum
 from app.ai.agents.base_agent import BaseAgent, AgentConfig
 from app.ai.workflow.workflow_manager import Workflow, BaseWorkflowStep, WorkflowContext, WorkflowResult
 from app.ai.tools.tool_registry import tool_registry
+from app.utils.time import utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,8 @@ class CrewConfig(BaseModel):
     description: Optional[str] = None
     agents: List[Dict[str, Any]] = Field(default_factory=list)
     workflow: Optional[Dict[str, Any]] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 class CrewMember(BaseModel):
@@ -42,11 +43,10 @@ class Crew(BaseModel):
     members: Dict[str, CrewMember] = Field(default_factory=dict)
     workflow: Optional[Workflow] = None
     status: CrewStatus = CrewStatus.IDLE
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
     
     def add_member(self, agent: BaseAgent, role: str, goal: str, backstory: Optional[str] = None) -> 'Crew':
         """Add a member to the crew."""
@@ -60,7 +60,7 @@ class Crew(BaseModel):
         )
         
         self.members[agent.config.id] = member
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
         
         # Add agent to workflow if not already present
         if self.workflow and agent.config.id not in [step.name for step in self.workflow.steps]:
@@ -80,7 +80,7 @@ class Crew(BaseModel):
             raise ValueError("No workflow defined for this crew")
         
         self.status = CrewStatus.PROCESSING
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
         
         try:
             # Prepare initial context
@@ -88,7 +88,7 @@ class Crew(BaseModel):
                 'task': task,
                 'context': context or {},
                 'crew_id': self.config.crew_id,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': utcnow().isoformat()
             }
             
             # Execute the workflow
@@ -96,13 +96,13 @@ class Crew(BaseModel):
             
             # Update status
             self.status = CrewStatus.IDLE
-            self.updated_at = datetime.utcnow()
+            self.updated_at = utcnow()
             
             return result
             
         except Exception as e:
             self.status = CrewStatus.ERROR
-            self.updated_at = datetime.utcnow()
+            self.updated_at = utcnow()
             logger.error(f"Error executing task in crew {self.config.crew_id}: {str(e)}", exc_info=True)
             raise
 
@@ -1,3 +1,3 @@
-from .embedding_utils import EmbeddingUtils, embedding_utils
+from .embedding_utils import EmbeddingDimensionError, EmbeddingUtils, embedding_utils
 
-__all__ = ["EmbeddingUtils", "embedding_utils"]
+__all__ = ["EmbeddingDimensionError", "EmbeddingUtils", "embedding_utils"]
@@ -1,7 +1,25 @@
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 import numpy as np
 from loguru import logger
-from ..core.config import settings
+from ...core.config import settings
+
+# OpenAI models whose output size can't be changed with the dimensions parameter
+OPENAI_FIXED_DIMENSIONS = {"text-embedding-ada-002": 1536}
+
+# Local models trained Matryoshka-style, whose leading dimensions still make a
+# usable embedding. Any other model must produce exactly EMBEDDING_DIM values.
+MATRYOSHKA_MODELS = frozenset({
+    "nomic-ai/nomic-embed-text-v1.5",
+    "mixedbread-ai/mxbai-embed-large-v1",
+    "tomaarsen/mpnet-base-nli-matryoshka",
+})
+
+class EmbeddingDimensionError(ValueError):
+    """The embedding model can't produce vectors of the configured size"""
 
 class EmbeddingUtils:
     """Utility class for handling text embeddings with support for multiple providers"""
@@ -10,11 +28,27 @@ class EmbeddingUtils:
         self.model_name = model_name or settings.EMBEDDING_MODEL
         self.dimensions = kwargs.get('dimensions', settings.EMBEDDING_DIM)
         self._embedding_model = None
+        self._load_lock = threading.Lock()
+        # LRU of recent embeddings, keyed by a digest of the text
+        self._cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._cache_size = kwargs.get('cache_size', settings.EMBEDDING_CACHE_SIZE)
+        
+        # Vectors of the wrong size would be rejected by every upsert, so
+        # refuse the configuration up front
+        fixed_dimensions = OPENAI_FIXED_DIMENSIONS.get(self.model_name)
+        if fixed_dimensions and fixed_dimensions != self.dimensions:
+            raise EmbeddingDimensionError(
+                f"{self.model_name} produces {fixed_dimensions}-dim embeddings, "
+                f"but EMBEDDING_DIM is {self.dimensions}"
+            )
         
     async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Get embeddings for a list of texts
         
+        Texts embedded recently are served from an in-process cache; the rest
+        (de-duplicated) go to the provider in one call.
+        
         Args:
             texts: List of text strings to embed
             
@@ -23,22 +57,49 @@ class EmbeddingUtils:
         """
         if not texts:
             return []
-            
-        try:
-            # Try to use the most appropriate embedding model based on configuration
-            if self.model_name.startswith("text-embedding"):
-                return await self._get_openai_embeddings(texts)
-            elif "bge-" in self.model_name or "bge_" in self.model_name:
-                return await self._get_huggingface_embeddings(texts)
+        
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+        found: Dict[bytes, List[float]] = {}
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key in found or key in missing:
+                continue
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                found[key] = self._cache[key]
             else:
-                # Default to sentence-transformers
-                return await self._get_sentence_transformers_embeddings(texts)
-                
-        except Exception as e:
-            logger.error(f"Error getting embeddings: {str(e)}")
-            # Return random embeddings as fallback (not recommended for production)
-            logger.warning("Using random embeddings as fallback")
-            return [self._get_random_embedding() for _ in texts]
+                missing[key] = text
+        
+        if missing:
+            try:
+                embeddings = await self._get_provider_embeddings(list(missing.values()))
+            except EmbeddingDimensionError:
+                # A misconfiguration, not an outage: random vectors would hide it
+                raise
+            except Exception as e:
+                logger.error(f"Error getting embeddings: {str(e)}")
+                # Return random embeddings as fallback (not recommended for production)
+                logger.warning("Using random embeddings as fallback")
+                return [self._get_random_embedding() for _ in texts]
+            
+            for key, embedding in zip(missing, embeddings):
+                found[key] = embedding
+                self._cache[key] = embedding
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        
+        return [found[key] for key in keys]
+    
+    async def _get_provider_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with the configured provider, raising on failure"""
+        # Try to use the most appropriate embedding model based on configuration
+        if self.model_name.startswith("text-embedding"):
+            return await self._get_openai_embeddings(texts)
+        elif "bge-" in self.model_name or "bge_" in self.model_name:
+            return await self._get_huggingface_embeddings(texts)
+        else:
+            # Default to sentence-transformers
+            return await self._get_sentence_transformers_embeddings(texts)
     
     async def _get_openai_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Get embeddings using OpenAI's API"""
@@ -46,57 +107,72 @@ class EmbeddingUtils:
             from openai import AsyncOpenAI
             
             client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            # Newer models shorten their (Matryoshka) output server-side
+            extra = {} if self.model_name in OPENAI_FIXED_DIMENSIONS else {"dimensions": self.dimensions}
             response = await client.embeddings.create(
                 input=texts,
-                model=self.model_name
+                model=self.model_name,
+                **extra
             )
             return [item.embedding for item in response.data]
             
         except ImportError:
             logger.warning("OpenAI client not installed. Falling back to random embeddings.")
-            return [self._get_random_embedding() for _ in texts]
+            raise
     
     async def _get_huggingface_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Get embeddings using HuggingFace models"""
-        try:
-            from sentence_transformers import SentenceTransformer
-            import torch
-            
-            if self._embedding_model is None:
-                device = 'cuda' if torch.cuda.is_available() else 'cpu'
-                self._embedding_model = SentenceTransformer(
-                    self.model_name,
-                    device=device
-                )
-                
-            # Convert to numpy and then to list for JSON serialization
-            embeddings = self._embedding_model.encode(texts, convert_to_tensor=False)
-            return [embedding.tolist() for embedding in embeddings]
-            
-        except ImportError:
-            logger.warning("sentence-transformers not installed. Falling back to random embeddings.")
-            return [self._get_random_embedding() for _ in texts]
+        return await self._get_local_embeddings(texts)
     
     async def _get_sentence_transformers_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Get embeddings using sentence-transformers"""
+        return await self._get_local_embeddings(texts)
+    
+    async def _get_local_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Encode texts with the local model in a worker thread"""
         try:
-            from sentence_transformers import SentenceTransformer
-            import torch
-            
-            if self._embedding_model is None:
-                device = 'cuda' if torch.cuda.is_available() else 'cpu'
-                self._embedding_model = SentenceTransformer(
-                    'all-MiniLM-L6-v2',  # Default model
-                    device=device
-                )
-                
-            # Convert to numpy and then to list for JSON serialization
-            embeddings = self._embedding_model.encode(texts, convert_to_tensor=False)
-            return [embedding.tolist() for embedding in embeddings]
-            
+            # Inference blocks, so keep it off the event loop
+            return await asyncio.to_thread(self._encode, texts)
         except ImportError:
             logger.warning("sentence-transformers not installed. Falling back to random embeddings.")
-            return [self._get_random_embedding() for _ in texts]
+            raise
+    
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """Encode a batch of texts, loading the model on first use"""
+        if self._embedding_model is None:
+            with self._load_lock:
+                if self._embedding_model is None:
+                    from sentence_transformers import SentenceTransformer
+                    import torch
+                    
+                    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+                    self._embedding_model = SentenceTransformer(
+                        self.model_name,
+                        device=device
+                    )
+        
+        embeddings = self._embedding_model.encode(
+            texts,
+            batch_size=settings.EMBEDDING_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True
+        )
+        # Convert to list for JSON serialization
+        return self._truncate(embeddings).tolist()
+    
+    def _truncate(self, embeddings: np.ndarray) -> np.ndarray:
+        """Cut (Matryoshka-style) embeddings down to self.dimensions and re-normalize"""
+        model_dimensions = self._embedding_model.get_sentence_embedding_dimension()
+        if model_dimensions == self.dimensions:
+            return embeddings
+        # Truncating any other model's output leaves an arbitrary slice of it
+        if self.model_name not in MATRYOSHKA_MODELS or model_dimensions < self.dimensions:
+            raise EmbeddingDimensionError(
+                f"{self.model_name} produces {model_dimensions}-dim embeddings, "
+                f"but EMBEDDING_DIM is {self.dimensions}"
+            )
+        embeddings = embeddings[:, :self.dimensions]
+        return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
     
     def _get_random_embedding(self) -> List[float]:
         """Generate a random embedding (for testing/fallback only)"""
@@ -5,12 +5,14 @@ This module provides integration with the CrewAI framework for multi-agent colla
 It includes classes for creating and managing agents, crews, and workflow steps.
 """
 
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Type, Union, TypeVar, Callable
-from functools import wraps
-from datetime import datetime
+from functools import partial, wraps
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from crewai import Agent as CrewAIAgent
 from crewai.crew import Crew as CrewAICrew
 from crewai.process import Process as CrewAIProcess
@@ -19,12 +21,25 @@ from crewai.task import Task as CrewAITask
 from ..agents.base_agent import BaseAgent, AgentConfig
 from ..workflow.workflow_manager import Workflow, BaseWorkflowStep, WorkflowContext
 from ...core.config import settings
+from ...utils.time import iso_from_ns
 
 logger = logging.getLogger(__name__)
 
 # Type variables for generic type hints
 T = TypeVar('T')
 
+# Crew.kickoff is synchronous and can run for minutes, so crews get their own
+# threads instead of tying up the event loop's default executor
+_crew_executor = ThreadPoolExecutor(
+    max_workers=settings.CREW_WORKERS,
+    thread_name_prefix="crewai"
+)
+
+async def kickoff_crew(crew: CrewAICrew, **kwargs) -> Any:
+    """Run a crew's blocking kickoff on the crew thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_crew_executor, partial(crew.kickoff, **kwargs))
+
 def handle_crewai_errors(func: Callable) -> Callable:
     """Decorator to handle common CrewAI errors."""
     @wraps(func)
@@ -66,7 +81,8 @@ class CrewAIConfig(BaseModel):
         description="Maximum number of worker threads"
     )
     
-    @validator('process')
+    @field_validator('process')
+    @classmethod
     def validate_process(cls, v):
         """Validate the process type."""
         valid_processes = ["sequential", "hierarchical", "parallel"]
@@ -85,7 +101,7 @@ class CrewAIAgentWrapper(BaseAgent):
             'success_count': 0,
             'error_count': 0,
             'total_duration': 0.0,
-            'last_execution': None
+            'last_execution_ns': None  # time.time_ns(); formatted by get_metrics
         }
     
     @handle_crewai_errors
@@ -103,7 +119,6 @@ class CrewAIAgentWrapper(BaseAgent):
             ValueError: If input validation fails
             RuntimeError: If execution fails
         """
-        import time
         start_time = time.time()
         self._metrics['execution_count'] += 1
         
@@ -134,7 +149,7 @@ class CrewAIAgentWrapper(BaseAgent):
             self._metrics.update({
                 'success_count': self._metrics['success_count'] + 1,
                 'total_duration': self._metrics['total_duration'] + duration,
-                'last_execution': datetime.utcnow().isoformat(),
+                'last_execution_ns': time.time_ns(),
                 'last_duration': duration
             })
             
@@ -147,7 +162,7 @@ class CrewAIAgentWrapper(BaseAgent):
         except Exception as e:
             self._metrics['error_count'] += 1
             self._metrics['last_error'] = str(e)
-            self._metrics['last_execution'] = datetime.utcnow().isoformat()
+            self._metrics['last_execution_ns'] = time.time_ns()
             
             logger.error(f"Error in CrewAIAgentWrapper.process: {str(e)}", exc_info=True)
             return {
@@ -158,7 +173,11 @@ class CrewAIAgentWrapper(BaseAgent):
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get the current metrics for this agent."""
-        return self._metrics
+        last_execution_ns = self._metrics['last_execution_ns']
+        return {
+            **self._metrics,
+            'last_execution': iso_from_ns(last_execution_ns) if last_execution_ns else None
+        }
 
 class CrewAIIntegration:
     """
@@ -337,7 +356,8 @@ class CrewAIIntegration:
         
         try:
             # Create and execute the task
-            result = await crew.kickoff(
+            result = await kickoff_crew(
+                crew,
                 inputs={
                     "task": task,
                     "context": context or {}
@@ -398,7 +418,7 @@ class CrewAIWorkflowStep(BaseWorkflowStep):
             'success_count': 0,
             'error_count': 0,
             'total_duration': 0.0,
-            'last_execution': None
+            'last_execution_ns': None  # time.time_ns(); formatted by get_metrics
         }
     
     async def _execute(self, context: WorkflowContext) -> Dict[str, Any]:
@@ -414,7 +434,6 @@ class CrewAIWorkflowStep(BaseWorkflowStep):
         Raises:
             RuntimeError: If execution fails
         """
-        import time
         start_time = time.time()
         self._metrics['execution_count'] += 1
         
@@ -435,7 +454,8 @@ class CrewAIWorkflowStep(BaseWorkflowStep):
                 raise ValueError(error_msg)
             
             # Execute the task
-            result = await crew.kickoff(
+            result = await kickoff_crew(
+                crew,
                 inputs={
                     "task": task,
                     "context": context.data
@@ -447,7 +467,7 @@ class CrewAIWorkflowStep(BaseWorkflowStep):
             self._metrics.update({
                 'success_count': self._metrics['success_count'] + 1,
                 'total_duration': self._metrics['total_duration'] + duration,
-                'last_execution': datetime.utcnow().isoformat(),
+                'last_execution_ns': time.time_ns(),
                 'last_duration': duration
             })
             
@@ -469,7 +489,7 @@ class CrewAIWorkflowStep(BaseWorkflowStep):
             self._metrics.update({
                 'error_count': self._metrics['error_count'] + 1,
                 'last_error': error_msg,
-                'last_execution': datetime.utcnow().isoformat()
+                'last_execution_ns': time.time_ns()
             })
             
             return {
@@ -487,4 +507,8 @@ class CrewAIWorkflowStep(BaseWorkflowStep):
         Returns:
             Dictionary containing execution metrics
         """
-        return self._metrics
+        last_execution_ns = self._metrics['last_execution_ns']
+        return {
+            **self._metrics,
+            'last_execution': iso_from_ns(last_execution_ns) if last_execution_ns else None
+        }
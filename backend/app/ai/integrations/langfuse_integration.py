@@ -2,9 +2,12 @@
 Integration with Langfuse for monitoring and observability.
 """
 from typing import Dict, List, Optional, Any, Union, Callable, TypeVar, Generic, Type
+import asyncio
 import logging
+from collections import OrderedDict
 from contextlib import contextmanager, asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 import os
 
 from pydantic import BaseModel, Field
@@ -65,6 +68,42 @@ class LangfuseConfig(BaseModel):
         default=False,
         description="Enable debug logging"
     )
+    max_cached_handlers: int = Field(
+        default=256,
+        description="Maximum number of per-trace callback handlers kept in memory"
+    )
+    log_queue_size: int = Field(
+        default=10000,
+        description="Execution logs buffered for the background sender; newer ones are dropped when full"
+    )
+    log_batch_size: int = Field(
+        default=50,
+        description="Execution logs written per Langfuse flush"
+    )
+
+@lru_cache(maxsize=None)
+def _get_langfuse(
+    public_key: Optional[str],
+    secret_key: Optional[str],
+    host: str,
+    debug: bool,
+    flush_at: int,
+    flush_interval: int
+) -> Langfuse:
+    """
+    Return the process-wide Langfuse client for a set of credentials.
+    
+    Each client owns an HTTP connection pool and a background flush thread, so
+    integrations and callback handlers share one instead of creating their own.
+    """
+    return Langfuse(
+        public_key=public_key,
+        secret_key=secret_key,
+        host=host,
+        debug=debug,
+        flush_at=flush_at,
+        flush_interval=flush_interval
+    )
 
 class LangfuseIntegration:
     """Handles integration with Langfuse for monitoring and observability."""
@@ -72,7 +111,10 @@ class LangfuseIntegration:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = LangfuseConfig(**(config or {}))
         self._langfuse = None
-        self._handler_cache = {}
+        self._handler_cache: "OrderedDict[str, CallbackHandler]" = OrderedDict()
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_sender: Optional[asyncio.Task] = None
+        self.dropped_logs = 0
         
         if not self.config.enabled:
             logger.info("Langfuse integration is disabled")
@@ -86,13 +128,13 @@ class LangfuseIntegration:
             return
         
         try:
-            self._langfuse = Langfuse(
-                public_key=self.config.public_key,
-                secret_key=self.config.secret_key,
-                host=self.config.host,
-                debug=self.config.debug,
-                flush_at=self.config.flush_at,
-                flush_interval=self.config.flush_interval
+            self._langfuse = _get_langfuse(
+                self.config.public_key,
+                self.config.secret_key,
+                self.config.host,
+                self.config.debug,
+                self.config.flush_at,
+                self.config.flush_interval
             )
             logger.info("Langfuse integration initialized")
         except Exception as e:
@@ -109,16 +151,22 @@ class LangfuseIntegration:
         if not self.is_enabled or not trace_id:
             return None
             
-        if trace_id not in self._handler_cache:
-            self._handler_cache[trace_id] = CallbackHandler(
-                public_key=self.config.public_key,
-                secret_key=self.config.secret_key,
-                host=self.config.host,
-                trace_name=trace_id,
-                trace_id=trace_id
-            )
+        handler = self._handler_cache.get(trace_id)
+        if handler is not None:
+            self._handler_cache.move_to_end(trace_id)
+            return handler
         
-        return self._handler_cache[trace_id]
+        # Bind the handler to a trace on the shared client; a handler built
+        # from credentials would start a client (and flush thread) of its own
+        handler = self._langfuse.trace(id=trace_id, name=trace_id).get_langchain_handler()
+        self._handler_cache[trace_id] = handler
+        
+        # Trace IDs are unique per execution, so evict the oldest handlers
+        # instead of holding one for every request ever served
+        while len(self._handler_cache) > self.config.max_cached_handlers:
+            self._handler_cache.popitem(last=False)
+        
+        return handler
     
     @asynccontextmanager
     async def trace(
@@ -166,46 +214,22 @@ class LangfuseIntegration:
         trace_id: Optional[str] = None,
         **kwargs
     ) -> Optional[str]:
-        """Log an agent execution to Langfuse."""
+        """
+        Queue an agent execution to be logged to Langfuse.
+        
+        Returns the trace ID straight away; the trace is written by a
+        background sender, so Langfuse latency or outages never hold up the
+        caller.
+        """
         if not self.is_enabled:
             return None
         
         trace_id = trace_id or f"agent_{agent_id}_{datetime.utcnow().isoformat()}"
-        
-        try:
-            with self.trace(
-                name=f"Agent Execution: {agent_id}",
-                trace_id=trace_id,
-                metadata={"agent_id": agent_id, **(metadata or {})}
-            ) as trace:
-                # Log the input
-                trace.span(
-                    name="agent_input",
-                    input=input_data,
-                    metadata={"agent_id": agent_id}
-                )
-                
-                # Log the output
-                trace.span(
-                    name="agent_output",
-                    output=output_data,
-                    metadata={"agent_id": agent_id}
-                )
-                
-                # Log any metrics
-                if "metrics" in output_data:
-                    for metric_name, metric_value in output_data["metrics"].items():
-                        trace.score(
-                            name=metric_name,
-                            value=float(metric_value),
-                            comment=f"Agent metric: {metric_name}"
-                        )
-                
-                return trace_id
-                
-        except Exception as e:
-            logger.error(f"Failed to log agent execution to Langfuse: {str(e)}")
-            return None
+        self._enqueue_log(
+            self._write_agent_execution,
+            trace_id, agent_id, dict(input_data), dict(output_data), dict(metadata or {})
+        )
+        return trace_id
     
     async def log_workflow_execution(
         self,
@@ -217,57 +241,169 @@ class LangfuseIntegration:
         trace_id: Optional[str] = None,
         **kwargs
     ) -> Optional[str]:
-        """Log a workflow execution to Langfuse."""
+        """Queue a workflow execution to be logged to Langfuse."""
         if not self.is_enabled:
             return None
         
         trace_id = trace_id or f"workflow_{workflow_id}_{datetime.utcnow().isoformat()}"
+        self._enqueue_log(
+            self._write_workflow_execution,
+            trace_id, workflow_id, dict(input_data), dict(output_data), list(steps), dict(metadata or {})
+        )
+        return trace_id
+    
+    def _enqueue_log(self, writer: Callable[..., None], *args: Any) -> None:
+        """Hand a log write to the background sender, dropping it if the queue is full"""
+        if self._log_queue is None:
+            self._log_queue = asyncio.Queue(maxsize=self.config.log_queue_size)
+        if self._log_sender is None or self._log_sender.done():
+            self._log_sender = asyncio.create_task(self._send_logs())
         
         try:
-            with self.trace(
-                name=f"Workflow Execution: {workflow_id}",
-                trace_id=trace_id,
-                metadata={"workflow_id": workflow_id, **(metadata or {})}
-            ) as trace:
-                # Log the workflow input
-                trace.span(
-                    name="workflow_input",
-                    input=input_data,
-                    metadata={"workflow_id": workflow_id}
+            self._log_queue.put_nowait((writer, args))
+        except asyncio.QueueFull:
+            self.dropped_logs += 1
+            if self.dropped_logs % 1000 == 1:
+                logger.warning(f"Langfuse log queue full; {self.dropped_logs} execution logs dropped")
+    
+    async def _send_logs(self) -> None:
+        """Write queued logs in batches, with one Langfuse flush per batch"""
+        while True:
+            batch = [await self._log_queue.get()]
+            while len(batch) < self.config.log_batch_size and not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+            
+            try:
+                # The SDK's trace calls and flush block, so keep them off the event loop
+                await asyncio.to_thread(self._write_logs, batch)
+            except Exception as e:
+                logger.error(f"Failed to send execution logs to Langfuse: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+    
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """
+        Send queued execution logs, then stop the background sender.
+        
+        Waits up to timeout seconds for the queue to drain and again for the
+        final Langfuse flush; logs still queued after that are dropped.
+        """
+        sender = self._log_sender
+        if sender is not None and not sender.done():
+            try:
+                await asyncio.wait_for(self._log_queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropped {self._log_queue.qsize()} queued Langfuse logs at shutdown")
+            sender.cancel()
+            try:
+                await sender
+            except asyncio.CancelledError:
+                pass
+        self._log_sender = None
+        
+        if self.is_enabled:
+            try:
+                await asyncio.wait_for(asyncio.to_thread(self._langfuse.flush), timeout)
+            except Exception as e:
+                logger.warning(f"Failed to flush Langfuse on shutdown: {str(e)}")
+    
+    def _write_logs(self, batch: List[Any]) -> None:
+        """Write a batch of queued logs and flush them to Langfuse"""
+        for writer, args in batch:
+            try:
+                writer(*args)
+            except Exception as e:
+                logger.error(f"Failed to log execution to Langfuse: {str(e)}")
+        self._langfuse.flush()
+    
+    def _write_agent_execution(
+        self,
+        trace_id: str,
+        agent_id: str,
+        input_data: Dict[str, Any],
+        output_data: Dict[str, Any],
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Write one agent execution trace"""
+        trace = self._langfuse.trace(
+            id=trace_id,
+            name=f"Agent Execution: {agent_id}",
+            metadata={"agent_id": agent_id, **metadata}
+        )
+        
+        # Log the input
+        trace.span(
+            name="agent_input",
+            input=input_data,
+            metadata={"agent_id": agent_id}
+        )
+        
+        # Log the output
+        trace.span(
+            name="agent_output",
+            output=output_data,
+            metadata={"agent_id": agent_id}
+        )
+        
+        # Log any metrics
+        if "metrics" in output_data:
+            for metric_name, metric_value in output_data["metrics"].items():
+                trace.score(
+                    name=metric_name,
+                    value=float(metric_value),
+                    comment=f"Agent metric: {metric_name}"
                 )
-                
-                # Log each step
-                for step in steps:
-                    step_span = trace.span(
-                        name=f"step_{step.get('step_id', 'unknown')}",
-                        input=step.get("input", {}),
-                        output=step.get("output", {}),
-                        metadata={
-                            "step_id": step.get("step_id"),
-                            "status": step.get("status"),
-                            "start_time": step.get("start_time"),
-                            "end_time": step.get("end_time"),
-                        }
+    
+    def _write_workflow_execution(
+        self,
+        trace_id: str,
+        workflow_id: str,
+        input_data: Dict[str, Any],
+        output_data: Dict[str, Any],
+        steps: List[Dict[str, Any]],
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Write one workflow execution trace"""
+        trace = self._langfuse.trace(
+            id=trace_id,
+            name=f"Workflow Execution: {workflow_id}",
+            metadata={"workflow_id": workflow_id, **metadata}
+        )
+        
+        # Log the workflow input
+        trace.span(
+            name="workflow_input",
+            input=input_data,
+            metadata={"workflow_id": workflow_id}
+        )
+        
+        # Log each step
+        for step in steps:
+            step_span = trace.span(
+                name=f"step_{step.get('step_id', 'unknown')}",
+                input=step.get("input", {}),
+                output=step.get("output", {}),
+                metadata={
+                    "step_id": step.get("step_id"),
+                    "status": step.get("status"),
+                    "start_time": step.get("start_time"),
+                    "end_time": step.get("end_time"),
+                }
+            )
+            
+            # Log any step metrics
+            if "metrics" in step:
+                for metric_name, metric_value in step["metrics"].items():
+                    step_span.score(
+                        name=metric_name,
+                        value=float(metric_value),
+                        comment=f"Step metric: {metric_name}"
                     )
-                    
-                    # Log any step metrics
-                    if "metrics" in step:
-                        for metric_name, metric_value in step["metrics"].items():
-                            step_span.score(
-                                name=metric_name,
-                                value=float(metric_value),
-                                comment=f"Step metric: {metric_name}"
-                            )
-                
-                # Log the workflow output
-                trace.span(
-                    name="workflow_output",
-                    output=output_data,
-                    metadata={"workflow_id": workflow_id}
-                )
-                
-                return trace_id
-                
-        except Exception as e:
-            logger.error(f"Failed to log workflow execution to Langfuse: {str(e)}")
-            return None
+        
+        # Log the workflow output
+        trace.span(
+            name="workflow_output",
+            output=output_data,
+            metadata={"workflow_id": workflow_id}
+        )
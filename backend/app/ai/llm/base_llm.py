@@ -65,7 +65,7 @@ class BaseLLM(ABC):
         """Get the generation config with defaults."""
         default_config = GenerationConfig()
         if config is None:
-            return default_config.dict()
+            return default_config.model_dump()
         
         # Merge with defaults
-        return {**default_config.dict(), **config.dict(exclude_unset=True)}
+        return {**default_config.model_dump(), **config.model_dump(exclude_unset=True)}
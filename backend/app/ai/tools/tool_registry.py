@@ -46,6 +46,7 @@ class ToolRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._tools: Dict[str, BaseTool] = {}
+            cls._instance._names: tuple[str, ...] = ()
         return cls._instance
     
     def register(self, tool: BaseTool) -> None:
@@ -53,6 +54,7 @@ class ToolRegistry:
         if tool.name in self._tools:
             logger.warning(f"Tool with name '{tool.name}' is already registered and will be overwritten")
         self._tools[tool.name] = tool
+        self._names = tuple(self._tools)
         logger.info(f"Registered tool: {tool.name}")
     
     def register_multiple(self, tools: list[BaseTool]) -> None:
@@ -64,14 +66,15 @@ class ToolRegistry:
         """Get a tool by name."""
         return self._tools.get(name)
     
-    def list_tools(self) -> list[str]:
-        """List all registered tool names."""
-        return list(self._tools.keys())
+    def list_tools(self) -> tuple[str, ...]:
+        """List all registered tool names (a snapshot, rebuilt only when tools change)."""
+        return self._names
     
     def remove_tool(self, name: str) -> bool:
         """Remove a tool from the registry."""
         if name in self._tools:
             del self._tools[name]
+            self._names = tuple(self._tools)
             logger.info(f"Removed tool: {name}")
             return True
         logger.warning(f"Attempted to remove non-existent tool: {name}")
@@ -81,6 +84,7 @@ class ToolRegistry:
         """Clear all tools from the registry."""
         count = len(self._tools)
         self._tools.clear()
+        self._names = ()
         logger.info(f"Cleared all {count} tools from registry")
     
     async def execute_tool(self, tool_name: str, params: Dict[str, Any]) -> ToolResult:
@@ -1,6 +1,8 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Any, Optional, Tuple
-from uuid import uuid4
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -15,6 +17,7 @@ from langchain_core.embeddings import Embeddings
 from langchain_core.documents import Document
 
 from ..core.config import settings
+from ...utils.ids import new_ids
 
 class QdrantConfig(BaseModel):
     """Configuration for Qdrant connection"""
@@ -23,6 +26,7 @@ class QdrantConfig(BaseModel):
     collection_name: str = Field(..., description="Collection name for vectors")
     embedding_dim: int = Field(768, description="Dimension of the embedding vectors")
     distance_metric: str = Field("COSINE", description="Distance metric (COSINE, EUCLID, DOT)")
+    io_workers: int = Field(32, description="Threads for blocking Qdrant client calls")
 
 class QdrantVectorStore:
     """Wrapper around Qdrant Vector Store with Gemini embeddings"""
@@ -32,6 +36,12 @@ class QdrantVectorStore:
         self.config = config or self._load_config()
         self.embeddings = self._init_embeddings()
         self.client = self._init_client()
+        # The client is synchronous; its calls run on a dedicated pool so they
+        # neither block the event loop nor compete for the default executor
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=self.config.io_workers,
+            thread_name_prefix="qdrant-io"
+        )
         self._ensure_collection()
     
     def _load_config(self) -> QdrantConfig:
@@ -40,7 +50,8 @@ class QdrantVectorStore:
             url=os.getenv("QDRANT_URL", "http://localhost:6333"),
             api_key=os.getenv("QDRANT_API_KEY"),
             collection_name=os.getenv("QDRANT_COLLECTION", "documents"),
-            embedding_dim=int(os.getenv("EMBEDDING_DIM", "768")),
+            # Sized for the Gemini model below, not the orchestrator's EMBEDDING_DIM
+            embedding_dim=int(os.getenv("GEMINI_EMBEDDING_DIM", "768")),
             distance_metric=os.getenv("QDRANT_DISTANCE_METRIC", "COSINE"),
         )
     
@@ -58,6 +69,11 @@ class QdrantVectorStore:
             api_key=self.config.api_key,
         )
     
+    async def _run_io(self, func, *args, **kwargs) -> Any:
+        """Run a blocking client call on the I/O pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, partial(func, *args, **kwargs))
+    
     def _get_distance_metric(self) -> Distance:
         """Get the distance metric enum value"""
         metric_map = {
@@ -105,8 +121,8 @@ class QdrantVectorStore:
         
         # Prepare points for Qdrant
         points = []
-        for idx, (doc, embedding) in enumerate(zip(documents, embeddings)):
-            doc_id = str(uuid4())
+        doc_ids = new_ids(len(documents))
+        for doc_id, doc, embedding in zip(doc_ids, documents, embeddings):
             payload = {
                 "text": doc.page_content,
                 "metadata": {**doc.metadata, **(metadata or {})},
@@ -121,7 +137,8 @@ class QdrantVectorStore:
             )
         
         # Add to Qdrant
-        self.client.upsert(
+        await self._run_io(
+            self.client.upsert,
             collection_name=self.config.collection_name,
             points=points,
             **kwargs
@@ -144,7 +161,8 @@ class QdrantVectorStore:
         qdrant_filter = self._build_qdrant_filter(filter) if filter else None
         
         # Search in Qdrant
-        search_result = self.client.search(
+        search_result = await self._run_io(
+            self.client.search,
             collection_name=self.config.collection_name,
             query_vector=query_embedding,
             query_filter=qdrant_filter,
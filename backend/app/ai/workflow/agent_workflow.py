@@ -8,7 +8,7 @@ from enum import Enum
 from datetime import datetime, timedelta
 import json
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -32,6 +32,9 @@ class AgentWorkflowStepType(str, Enum):
     API_CALL = "api_call"
     DATA_TRANSFORM = "data_transform"
 
+# Value -> member lookup for step type parsing on the request path
+_STEP_TYPES_BY_VALUE = {step_type.value: step_type for step_type in AgentWorkflowStepType}
+
 class AgentWorkflowStep(BaseModel):
     """A single step in an agent workflow."""
     step_id: str
@@ -45,10 +48,14 @@ class AgentWorkflowStep(BaseModel):
     retry_policy: Dict[str, Any] = Field(default_factory=dict)
     timeout: Optional[float] = None
     
-    @validator('step_type', pre=True)
+    @field_validator('step_type', mode='before')
+    @classmethod
     def validate_step_type(cls, v):
         if isinstance(v, AgentWorkflowStepType):
             return v
+        step_type = _STEP_TYPES_BY_VALUE.get(v)
+        if step_type is not None:
+            return step_type
         return AgentWorkflowStepType(v.lower())
     
     def get_retry_config(self) -> Dict[str, Any]:
@@ -263,7 +270,7 @@ class AgentTaskStep(BaseWorkflowStep):
                 "end_time": datetime.utcnow().isoformat(),
                 "execution_time_ms": (datetime.utcnow() - step_start).total_seconds() * 1000,
                 "success": True,
-                "output": result.dict() if hasattr(result, 'dict') else result
+                "output": result.model_dump() if isinstance(result, BaseModel) else result
             })
             
             # Save the result to the workflow context
@@ -1,9 +1,12 @@
 from typing import Dict, Any, List, Optional, Type, TypeVar, Generic, Union
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import time
 from enum import Enum
 
+from ...utils.time import utcnow
+
 # Import integrations
 from ..integrations import (
     CrewAIWorkflowStep,
@@ -13,6 +16,20 @@ from ..integrations import (
 
 logger = logging.getLogger(__name__)
 
+def state_ref(data: Dict[str, Any], execution_id: str, step: str) -> Dict[str, Any]:
+    """
+    Identify the workflow data a step log refers to, without serializing it.
+    
+    Step logs fire at every start, completion and failure, so they carry the
+    execution, step and data keys instead of the data itself; the full output
+    is logged once, when the workflow finishes.
+    """
+    return {
+        "execution_id": execution_id,
+        "step": step,
+        "keys": [str(key) for key in data]
+    }
+
 class WorkflowStatus(str, Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -37,7 +54,7 @@ class WorkflowContext(BaseModel):
     workflow_id: str
     execution_id: str
     status: WorkflowStatus = WorkflowStatus.PENDING
-    start_time: datetime = Field(default_factory=datetime.utcnow)
+    start_time: datetime = Field(default_factory=utcnow)
     end_time: Optional[datetime] = None
     current_step: Optional[str] = None
     steps: Dict[str, WorkflowStep] = Field(default_factory=dict)
@@ -68,7 +85,7 @@ class BaseWorkflowStep(ABC):
             step_id=step_id,
             name=self.name,
             status=WorkflowStatus.RUNNING,
-            start_time=datetime.utcnow(),
+            start_time=utcnow(),
             input=context.data.copy()
         )
         
@@ -77,13 +94,13 @@ class BaseWorkflowStep(ABC):
         
         try:
             # Execute the step
-            logger.info(f"Executing step: {self.name}")
+            logger.info("Executing step: %s", self.name)
             result = await self._execute(context)
             
             # Update step status
             step.status = WorkflowStatus.COMPLETED
             step.output = result
-            step.end_time = datetime.utcnow()
+            step.end_time = utcnow()
             
             # Update context with step result
             if result and isinstance(result, dict):
@@ -98,10 +115,10 @@ class BaseWorkflowStep(ABC):
             
             step.status = WorkflowStatus.FAILED
             step.error = error_msg
-            step.end_time = datetime.utcnow()
+            step.end_time = utcnow()
             
             context.status = WorkflowStatus.FAILED
-            context.end_time = datetime.utcnow()
+            context.end_time = utcnow()
             
             raise WorkflowError(f"Step '{self.name}' failed: {error_msg}")
     
@@ -147,7 +164,7 @@ class Workflow:
         Returns:
             WorkflowResult containing the execution result
         """
-        execution_id = f"exec_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        execution_id = f"exec_{utcnow().strftime('%Y%m%d_%H%M%S')}"
         trace_id = trace_id or f"workflow_{self.workflow_id}_{execution_id}"
         
         context = WorkflowContext(
@@ -162,7 +179,8 @@ class Workflow:
             }
         )
         
-        start_time = datetime.utcnow()
+        start_time = utcnow()
+        started = time.monotonic()
         langfuse = get_langfuse_integration()
         
         # Log workflow start to Langfuse
@@ -184,14 +202,15 @@ class Workflow:
         
         try:
             for step in self.steps:
-                step_start_time = datetime.utcnow()
+                step_start_time = utcnow()
+                step_started = time.monotonic()
                 step_trace_id = f"{trace_id}_step_{step.name}"
                 
                 # Log step start to Langfuse
                 if langfuse and langfuse.is_enabled:
                     await langfuse.log_agent_execution(
                         agent_id=step.name,
-                        input_data=context.data,
+                        input_data=state_ref(context.data, execution_id, step.name),
                         output_data={"status": "started"},
                         trace_id=step_trace_id,
                         metadata={
@@ -207,12 +226,12 @@ class Workflow:
                     context = await step.execute(context)
                     
                     # Log step completion
-                    step_duration = (datetime.utcnow() - step_start_time).total_seconds()
+                    step_duration = time.monotonic() - step_started
                     executed_steps.append({
                         "step_id": step.name,
                         "status": "completed",
                         "start_time": step_start_time.isoformat(),
-                        "end_time": datetime.utcnow().isoformat(),
+                        "end_time": (step_start_time + timedelta(seconds=step_duration)).isoformat(),
                         "duration_seconds": step_duration,
                         "step_type": step.__class__.__name__
                     })
@@ -221,7 +240,7 @@ class Workflow:
                     if langfuse and langfuse.is_enabled:
                         await langfuse.log_agent_execution(
                             agent_id=step.name,
-                            input_data=context.data,
+                            input_data=state_ref(context.data, execution_id, step.name),
                             output_data={
                                 "status": "completed",
                                 "duration_seconds": step_duration
@@ -237,19 +256,19 @@ class Workflow:
                         )
                     
                     # If any step fails, stop execution
-                    if context.status == WorkflowStatus.FAILED:
+                    if context.status is WorkflowStatus.FAILED:
                         break
                         
                 except Exception as step_error:
                     error_msg = str(step_error)
-                    step_duration = (datetime.utcnow() - step_start_time).total_seconds()
+                    step_duration = time.monotonic() - step_started
                     
                     # Log step failure
                     executed_steps.append({
                         "step_id": step.name,
                         "status": "failed",
                         "start_time": step_start_time.isoformat(),
-                        "end_time": datetime.utcnow().isoformat(),
+                        "end_time": (step_start_time + timedelta(seconds=step_duration)).isoformat(),
                         "duration_seconds": step_duration,
                         "error": error_msg,
                         "step_type": step.__class__.__name__
@@ -259,7 +278,7 @@ class Workflow:
                     if langfuse and langfuse.is_enabled:
                         await langfuse.log_agent_execution(
                             agent_id=step.name,
-                            input_data=context.data,
+                            input_data=state_ref(context.data, execution_id, step.name),
                             output_data={
                                 "status": "failed",
                                 "error": error_msg,
@@ -277,7 +296,7 @@ class Workflow:
                         )
                     
                     context.status = WorkflowStatus.FAILED
-                    context.end_time = datetime.utcnow()
+                    context.end_time = utcnow()
                     
                     # Re-raise the error to be handled by the workflow
                     raise WorkflowError(f"Step '{step.name}' failed: {error_msg}") from step_error
@@ -287,7 +306,7 @@ class Workflow:
             
             # Log workflow completion to Langfuse
             if langfuse and langfuse.is_enabled:
-                workflow_duration = (datetime.utcnow() - start_time).total_seconds()
+                workflow_duration = time.monotonic() - started
                 await langfuse.log_agent_execution(
                     agent_id=f"workflow_{self.workflow_id}",
                     input_data=initial_data or {},
@@ -311,8 +330,8 @@ class Workflow:
             
         except Exception as e:
             context.status = WorkflowStatus.FAILED
-            context.end_time = datetime.utcnow()
-            workflow_duration = (context.end_time - start_time).total_seconds()
+            context.end_time = utcnow()
+            workflow_duration = time.monotonic() - started
             
             # Log workflow failure to Langfuse
             if langfuse and langfuse.is_enabled:
@@ -345,8 +364,8 @@ class Workflow:
                 execution_time_ms=workflow_duration * 1000 if 'workflow_duration' in locals() else 0
             )
         
-        context.end_time = datetime.utcnow()
-        workflow_duration = (context.end_time - start_time).total_seconds()
+        context.end_time = utcnow()
+        workflow_duration = time.monotonic() - started
         
         return WorkflowResult(
             success=True,
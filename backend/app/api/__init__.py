@@ -5,6 +5,10 @@ api_router = APIRouter()
 
 # Import and include all endpoint routers
 from .v1.endpoints import agents as agents_router
+from .v1.endpoints import chat as chat_router
+from .v1.endpoints import workflows as workflows_router
 
-# Include versioned routers
-api_router.include_router(agents_router.router, prefix="/v1")
+# Versioned routers, mounted under /api/v1 by app.main
+api_router.include_router(agents_router.router)
+api_router.include_router(chat_router.router)
+api_router.include_router(workflows_router.router)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from pydantic import BaseModel
 import logging
 
@@ -31,6 +31,14 @@ class AgentResponseModel(BaseModel):
     tools: List[str]
     llm_config: Optional[Dict[str, Any]] = None
 
+class AgentListResponseCompact(BaseModel):
+    """Column-oriented agent list: field names are sent once instead of per row."""
+    columns: List[str]
+    rows: List[List[Any]]
+
+AGENT_LIST_COLUMNS = list(AgentResponseModel.model_fields)
+AGENT_RESPONSE_FIELDS = frozenset(AGENT_LIST_COLUMNS)
+
 class TaskRequest(BaseModel):
     task: str
     context: Dict[str, Any] = {}
@@ -57,17 +65,7 @@ async def create_agent(agent_data: AgentCreateRequest):
         
         # In a real implementation, you would store the agent and its config
         # For now, we'll just return the config
-        return {
-            "id": agent_config.id,
-            "name": agent_config.name,
-            "role": agent_config.role,
-            "goal": agent_config.goal,
-            "backstory": agent_config.backstory,
-            "verbose": agent_config.verbose,
-            "allow_delegation": agent_config.allow_delegation,
-            "tools": agent_config.tools,
-            "llm_config": agent_config.llm_config
-        }
+        return agent_config.model_dump(include=AGENT_RESPONSE_FIELDS)
         
     except Exception as e:
         logger.error(f"Error creating agent: {str(e)}", exc_info=True)
@@ -97,11 +95,16 @@ async def process_task(agent_id: str, task_request: TaskRequest):
             detail=f"Failed to process task: {str(e)}"
         )
 
-@router.get("/list", response_model=List[AgentResponseModel])
-async def list_agents():
-    """List all available agents."""
+@router.get("/list", response_model=Union[List[AgentResponseModel], AgentListResponseCompact])
+async def list_agents(compact: bool = False):
+    """
+    List all available agents.
+    
+    Pass ``compact=true`` to get ``{"columns": [...], "rows": [[...], ...]}``
+    instead of one object per agent, which keeps large listings small.
+    """
     # In a real implementation, you would return actual agents
-    return [
+    agents = [
         {
             "id": "agent_1",
             "name": "Support Agent",
@@ -123,6 +126,13 @@ async def list_agents():
             "llm_config": {"model": "gemini-1.5-pro"}
         }
     ]
+    
+    if compact:
+        return {
+            "columns": AGENT_LIST_COLUMNS,
+            "rows": [[agent.get(column) for column in AGENT_LIST_COLUMNS] for agent in agents]
+        }
+    return agents
 
 # Crew endpoints
 class CrewCreateRequest(BaseModel):
@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import Dict, Any
+import asyncio
+import logging
+
+from app.core.config import settings
+
+router = APIRouter(prefix="/chat", tags=["chat"])
+logger = logging.getLogger(__name__)
+
+async def get_orchestrator(request: Request):
+    """Return the AIOrchestrator, waiting for its background startup to finish."""
+    try:
+        await asyncio.wait_for(
+            request.app.state.ai_ready.wait(),
+            timeout=settings.AI_READY_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI Orchestrator is not ready yet"
+        )
+    if request.app.state.ai_error is not None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI Orchestrator failed to start"
+        )
+    return request.app.state.ai_orchestrator
+
+@router.post("", response_model=Dict[str, Any])
+async def chat_endpoint(
+    payload: Dict[str, Any],
+    orchestrator = Depends(get_orchestrator)
+) -> Dict[str, Any]:
+    """
+    Process a chat message through the AI workflow
+    
+    Request body:
+    - message: str - The user's message
+    - context: Dict - Any additional context
+    """
+    message = payload.get("message")
+    context = payload.get("context", {})
+    
+    if not message:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Message is required"
+        )
+    
+    try:
+        logger.info("Processing message: %.100s...", message)
+        
+        # Process the message through the AI orchestrator
+        response = await orchestrator.process_message(message, context)
+        
+        return {
+            "success": True,
+            "data": response,
+            "metadata": {
+                "model": response.get("metadata", {}).get("model", "unknown"),
+                "environment": settings.ENVIRONMENT
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"Error processing chat: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
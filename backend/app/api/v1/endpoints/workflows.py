@@ -4,11 +4,13 @@ API endpoints for managing and executing agent workflows.
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from fastapi.responses import JSONResponse
 from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from datetime import datetime
 import json
 import logging
 import uuid
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.ai.workflow.agent_workflow import AgentWorkflow, AgentWorkflowStep, AgentWorkflowStepType
 from app.ai.agents.agent_factory import agent_factory
@@ -19,6 +21,9 @@ logger = logging.getLogger(__name__)
 # In-memory store for workflows (in production, use a database)
 workflow_registry: Dict[str, AgentWorkflow] = {}
 
+# Built once so request validation reuses the compiled core schema
+workflow_steps_adapter = TypeAdapter(List[AgentWorkflowStep])
+
 class WorkflowStepCreate(BaseModel):
     """Model for creating a workflow step."""
     step_id: str
@@ -62,8 +67,25 @@ class WorkflowExecutionResponse(BaseModel):
     error: Optional[str] = None
     execution_time_ms: Optional[float] = None
 
-# In-memory store for workflow executions (in production, use a database)
-workflow_executions: Dict[str, Dict[str, Any]] = {}
+# In-memory store for workflow executions (in production, use a database),
+# oldest first. Finished executions beyond MAX_TRACKED_EXECUTIONS are dropped
+# so the store doesn't grow with every request ever served.
+MAX_TRACKED_EXECUTIONS = 1000
+workflow_executions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def track_execution(execution_record: Dict[str, Any]) -> None:
+    """Add an execution record, evicting the oldest finished ones over the limit."""
+    workflow_executions[execution_record["execution_id"]] = execution_record
+    
+    excess = len(workflow_executions) - MAX_TRACKED_EXECUTIONS
+    if excess <= 0:
+        return
+    finished = [
+        execution_id for execution_id, execution in workflow_executions.items()
+        if execution["status"] in ("completed", "failed")
+    ]
+    for execution_id in finished[:excess]:
+        del workflow_executions[execution_id]
 
 @router.post("/", response_model=WorkflowResponse, status_code=status.HTTP_201_CREATED)
 async def create_workflow(workflow_data: WorkflowCreate):
@@ -81,8 +103,10 @@ async def create_workflow(workflow_data: WorkflowCreate):
         )
         
         # Add steps to the workflow
-        for step_data in workflow_data.steps:
-            step = AgentWorkflowStep(**step_data.dict())
+        steps = workflow_steps_adapter.validate_python(
+            [step_data.model_dump() for step_data in workflow_data.steps]
+        )
+        for step in steps:
             workflow.add_step(step)
         
         # Validate the workflow
@@ -180,7 +204,7 @@ async def execute_workflow(
         "error": None
     }
     
-    workflow_executions[execution_id] = execution_record
+    track_execution(execution_record)
     
     async def _execute_workflow():
         """Execute the workflow and update the execution record."""
@@ -197,7 +221,7 @@ async def execute_workflow(
             execution_record.update({
                 "status": "completed" if result.success else "failed",
                 "end_time": datetime.utcnow().isoformat(),
-                "result": result.dict(),
+                "result": result.model_dump(),
                 "execution_time_ms": result.execution_time_ms
             })
             
@@ -223,7 +247,8 @@ async def execute_workflow(
         # Run synchronously
         await _execute_workflow()
         
-        execution = workflow_executions[execution_id]
+        # Read our own record: it may have been evicted from the tracker meanwhile
+        execution = execution_record
         
         return {
             "execution_id": execution_id,
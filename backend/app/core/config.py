@@ -1,5 +1,5 @@
-from pydantic_settings import BaseSettings
-from typing import List, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Literal, Optional
 from functools import lru_cache
 import os
 from pathlib import Path
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     VERSION: str = "1.0.0"
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
+    TESTING: bool = False
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = False  # one JSON object per line instead of colored text
     
     # API
     API_PREFIX: str = "/api/v1"
@@ -24,6 +27,9 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: List[str] = ["*"]
     
+    # Seconds a request waits for background service startup before a 503
+    AI_READY_TIMEOUT: int = 30
+    
     # Database (Aiven PostgreSQL)
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
@@ -31,6 +37,12 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str
     DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 300  # seconds
+    DB_STATEMENT_CACHE_SIZE: int = 500  # prepared statements per connection
+    DB_WARM_TIMEOUT: float = 5.0  # seconds to spend warming the pool at startup
     
     # LLM Providers
     OPENROUTER_API_KEY: Optional[str] = None
@@ -40,8 +52,11 @@ class Settings(BaseSettings):
     # Qdrant Vector Database
     QDRANT_URL: str = "http://localhost:6333"
     QDRANT_API_KEY: Optional[str] = None
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_PREFER_GRPC: bool = True
     QDRANT_COLLECTION: str = "documents"
     QDRANT_DISTANCE_METRIC: str = "COSINE"  # COSINE, EUCLID, or DOT
+    QDRANT_QUANTIZATION: Literal["int8", "binary"] = "int8"  # binary suits models with >= 1024 dims
     
     # Redis Cache
     REDIS_URL: str = "redis://localhost:6379"
@@ -52,20 +67,29 @@ class Settings(BaseSettings):
     CRAWL4AI_HEADLESS: bool = True
     CRAWL4AI_TIMEOUT: int = 30000  # 30 seconds
     CRAWL4AI_MAX_RETRIES: int = 3
+    CRAWL4AI_MAX_CONCURRENCY: int = 4  # Pages loaded at once in the shared browser
     
-    # Embedding Model (Gemini)
+    # Embedding Model
     GEMINI_EMBEDDING_MODEL: str = "models/embedding-001"
-    EMBEDDING_DIM: int = 768  # Dimension of Gemini's embedding vector
+    GEMINI_EMBEDDING_DIM: int = 768  # QdrantVectorStore collections, sized for the Gemini model
+    EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    EMBEDDING_DIM: int = 384  # Vectors from larger models are truncated to this size
+    EMBEDDING_BATCH_SIZE: int = 64
+    EMBEDDING_CACHE_SIZE: int = 4096  # Recent embeddings kept in-process
+    
+    # CrewAI
+    CREW_WORKERS: int = 8  # Crew runs executing at once
     
     # Langfuse Monitoring
     LANGFUSE_PUBLIC_KEY: Optional[str] = None
     LANGFUSE_SECRET_KEY: Optional[str] = None
     LANGFUSE_HOST: str = "https://cloud.langfuse.com"
     
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
-        env_file_encoding = 'utf-8'
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        env_file_encoding='utf-8'
+    )
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -1,16 +1,32 @@
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import NullPool
 from ..core.config import settings
 
+# Pool sizing only applies to the default queue pool, NullPool rejects it
+pool_options = {"poolclass": NullPool} if settings.TESTING else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
+# asyncpg keeps a per-connection cache of prepared statements, so repeated
+# queries skip parse/plan; size it explicitly instead of relying on the default
+connect_args = {}
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
     pool_pre_ping=True,
-    pool_recycle=300,
-    poolclass=NullPool if settings.TESTING else None
+    connect_args=connect_args,
+    **pool_options
 )
 
 # Create async session factory
@@ -21,6 +37,29 @@ async_session_factory = sessionmaker(
     autoflush=False
 )
 
+async def warm_connection_pool() -> int:
+    """Open the pool's connections up front so the first requests don't pay for them.
+
+    Connections still pending after ``DB_WARM_TIMEOUT`` seconds are abandoned,
+    so an unreachable database can't hold up startup.
+
+    Returns:
+        int: Number of connections that answered ``SELECT 1`` in time
+    """
+    size = 1 if settings.TESTING else settings.DB_POOL_SIZE
+
+    async def _warm() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    tasks = [asyncio.create_task(_warm()) for _ in range(size)]
+    done, pending = await asyncio.wait(tasks, timeout=settings.DB_WARM_TIMEOUT)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+    return sum(1 for task in done if not task.cancelled() and task.exception() is None)
+
 async def get_db() -> AsyncSession:
     """Dependency for getting async DB session"""
     async with async_session_factory() as session:
@@ -1,28 +1,56 @@
 import sys
-import json
+import inspect
+import logging
+import traceback
+import orjson
 from loguru import logger
 from ..core.config import settings
 
-class InterceptHandler:
-    """Intercept standard logging messages to Loguru"""
-    def write(self, message):
-        if message.strip() != "\n":
-            logger.debug(message.strip())
-    
-    def flush(self):
-        pass
+class InterceptHandler(logging.Handler):
+    """Route standard logging records to Loguru so there is a single sink"""
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        
+        # Find the caller outside the logging module so Loguru reports it
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+        
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+def json_sink(message) -> None:
+    """Write one JSON object per log record, encoded with orjson"""
+    record = message.record
+    entry = {
+        "ts": record["time"].timestamp(),
+        "lvl": record["level"].name,
+        "logger": record["name"],
+        "func": record["function"],
+        "line": record["line"],
+        "msg": record["message"],
+    }
+    if record["exception"]:
+        entry["exc"] = "".join(traceback.format_exception(*record["exception"]))
+    sys.stderr.write(orjson.dumps(entry, default=str).decode() + "\n")
 
 # Configure loguru
 logger.remove()
 
 # Add console logging
-logger.add(
-    sys.stderr,
-    level=settings.LOG_LEVEL,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-           "<level>{level: <8}</level> | "
-           "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-)
+if settings.LOG_JSON:
+    logger.add(json_sink, level=settings.LOG_LEVEL)
+else:
+    logger.add(
+        sys.stderr,
+        level=settings.LOG_LEVEL,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+               "<level>{level: <8}</level> | "
+               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+    )
 
 # Optionally add file logging in production
 if settings.ENVIRONMENT == "production":
@@ -36,5 +64,10 @@ if settings.ENVIRONMENT == "production":
     )
 
 # Intercept standard logging
-import logging
-logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO, force=True)
+logging.basicConfig(handlers=[InterceptHandler()], level=settings.LOG_LEVEL, force=True)
+
+# Uvicorn installs its own handlers on these; send them through the root logger
+for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+    uvicorn_logger = logging.getLogger(name)
+    uvicorn_logger.handlers.clear()
+    uvicorn_logger.propagate = True
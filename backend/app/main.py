@@ -1,26 +1,75 @@
-from fastapi import FastAPI, Depends, HTTPException
+import asyncio
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from loguru import logger
-from typing import List
 
 from .core.config import settings
-from .api import api_router  # Updated import
+from .core.logger import logger
+from .api import api_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up AgentFlow Pro API...")
     
-    # Initialize services here
-    from .services.ai.orchestrator import AIOrchestrator
-    app.state.ai_orchestrator = AIOrchestrator()
-    logger.info("AI Orchestrator initialized")
+    # Warm the database pool before traffic arrives
+    from .core.database import warm_connection_pool
+    try:
+        warmed = await warm_connection_pool()
+        logger.info(f"Database connection pool warmed ({warmed} connections)")
+    except Exception as e:
+        logger.warning(f"Could not warm database connection pool: {str(e)}")
+    
+    # Initialize the AI Orchestrator in the background so startup isn't
+    # blocked on model loading and vector store checks. ai_ready is set once
+    # startup has finished either way; ai_error records why it failed.
+    app.state.ai_orchestrator = None
+    app.state.ai_error = None
+    app.state.ai_ready = asyncio.Event()
+    
+    async def _init_orchestrator():
+        orchestrator = None
+        try:
+            from .services.ai.orchestrator import AIOrchestrator
+            orchestrator = await asyncio.to_thread(AIOrchestrator)
+            await orchestrator.initialize()
+        except asyncio.CancelledError:
+            # Shut down mid-startup: release whatever was already opened
+            if orchestrator is not None:
+                await orchestrator.close()
+            raise
+        except Exception as e:
+            logger.opt(exception=True).error(f"Error initializing AI Orchestrator: {str(e)}")
+            app.state.ai_error = e
+            app.state.ai_ready.set()
+            if orchestrator is not None:
+                await orchestrator.close()
+            return
+        
+        app.state.ai_orchestrator = orchestrator
+        app.state.ai_ready.set()
+        logger.info("AI Orchestrator initialized")
+    
+    app.state.ai_init_task = asyncio.create_task(_init_orchestrator())
     
     yield
     
     # Shutdown
     logger.info("Shutting down AgentFlow Pro API...")
+    app.state.ai_init_task.cancel()
+    try:
+        await app.state.ai_init_task
+    except asyncio.CancelledError:
+        pass
+    if app.state.ai_orchestrator is not None:
+        await app.state.ai_orchestrator.close()
+    
+    # Send execution logs still buffered for Langfuse
+    from .ai.integrations import get_langfuse_integration
+    langfuse = get_langfuse_integration()
+    if langfuse is not None:
+        await langfuse.aclose()
 
 app = FastAPI(
     title="AgentFlow Pro API",
@@ -29,6 +78,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -44,14 +94,43 @@ app.add_middleware(
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
+def _ai_status() -> str:
+    if app.state.ai_error is not None:
+        return "failed"
+    if app.state.ai_ready.is_set():
+        return "healthy"
+    return "starting"
+
 @app.get("/health")
 async def health_check():
+    """Liveness: the process is serving requests, whatever the AI status"""
     return {
-        "status": "healthy",
+        "status": "ok",
+        "ai_status": _ai_status(),
         "version": app.version,
         "environment": settings.ENVIRONMENT
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 503 until the AI Orchestrator is up, or if it failed to start"""
+    ai_status = _ai_status()
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK if ai_status == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": ai_status,
+            "version": app.version,
+            "environment": settings.ENVIRONMENT
+        }
+    )
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        # Logging is set up by app.core.logger, which routes uvicorn to Loguru
+        log_config=None
+    )
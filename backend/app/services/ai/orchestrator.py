@@ -1,7 +1,8 @@
 import asyncio
-import json
 import os
-from typing import Dict, Any, List, Optional, Union, Tuple
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Union, Tuple, Callable, Awaitable, TypedDict
 from langchain_core.messages import HumanMessage, AIMessage
 from langgraph.graph import StateGraph, END
 from loguru import logger
@@ -11,58 +12,321 @@ from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
-from upstash_redis import Redis
+from upstash_redis.asyncio import Redis
 import hashlib
-from datetime import datetime, timedelta
+import random
+import secrets
+import numpy as np
+import orjson
 
-# Import embedding utilities
-from app.ai.embeddings import EmbeddingUtils, embedding_utils
+# Shared embedding model, loaded once per process
+from app.ai.embeddings import embedding_utils
+from app.utils.time import utcnow
+from .query_cache import QueryResultCache
 
-# Initialize embedding utilities
-embedding_utils = EmbeddingUtils()
+URL_PATTERN = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+')
+
+# Simple extraction schema for news/article sites linked from a message
+ARTICLE_SCHEMA = {
+    "title": "h1",
+    "content": ["article", ".content"],
+    "author": ["[itemprop='author']", ".author"],
+    "date": ["[itemprop='datePublished']", "time", ".date"]
+}
+
+# Embedding writes are coalesced into batches of this size, or whatever
+# arrived within EMBEDDING_BATCH_MAX_WAIT seconds of the first item
+EMBEDDING_BATCH_SIZE = 32
+EMBEDDING_BATCH_MAX_WAIT = 0.05
+
+# How long close() waits for background writes to finish
+BACKGROUND_DRAIN_TIMEOUT = 5.0
+
+# Concurrent similarity searches are merged into one search_batch request
+SEARCH_BATCH_SIZE = 32
+SEARCH_BATCH_MAX_WAIT = 0.005
+
+# Concurrent cache reads are sent as one MGET, writes as one pipeline
+CACHE_BATCH_SIZE = 64
+CACHE_BATCH_MAX_WAIT = 0.005
+
+# Cache TTLs are stretched by up to this fraction, so entries written
+# together don't all expire (and get recomputed) together
+CACHE_TTL_JITTER = 0.1
+
+# Only one caller crawls a given URL at a time: the others wait for its cached
+# result for as long as its lock exists, and crawl themselves only once the lock
+# is gone without a result. The lock expires on its own if its holder dies
+# mid-crawl; its TTL covers the page load plus time queued behind other crawls
+# for the browser semaphore, so it also bounds how long a waiter waits.
+CRAWL_LOCK_TTL_MS = 4 * settings.CRAWL4AI_TIMEOUT
+CRAWL_LOCK_POLL_MAX = 1.0
+
+# Deletes a lock only while it still holds the caller's token, so a holder
+# whose lock expired can't release one another caller has since taken
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Repeated (or reworded) searches within the TTL are answered in-process
+QUERY_CACHE_SIZE = 4096
+QUERY_CACHE_MIN_SIMILARITY = 0.98
+QUERY_CACHE_TTL = 300.0
+
+# Point payloads keep only the first TEXT_SNIPPET_LENGTH characters of a
+# document; search results only ever show that snippet
+TEXT_SNIPPET_LENGTH = 500
+
+# Keyword-indexed payload fields, usable in search_similar metadata_filters
+INDEXED_PAYLOAD_FIELDS = ("type", "source")
+
+# Vectors are quantized in RAM, either to INT8 or to 1 bit per dimension
+# (settings.QDRANT_QUANTIZATION). Binary loses more precision, so it
+# oversamples more candidates before rescoring them with the original vectors.
+QUANTIZATION_CONFIGS = {
+    "int8": models.ScalarQuantization(
+        scalar=models.ScalarQuantizationConfig(
+            type=models.ScalarType.INT8,
+            quantile=0.99,
+            always_ram=True
+        )
+    ),
+    "binary": models.BinaryQuantization(
+        binary=models.BinaryQuantizationConfig(always_ram=True)
+    ),
+}
+QUANTIZATION_OVERSAMPLING = {"int8": 2.0, "binary": 3.0}
+
+SEARCH_PARAMS = models.SearchParams(
+    hnsw_ef=100,
+    quantization=models.QuantizationSearchParams(
+        ignore=False,
+        rescore=True,
+        oversampling=QUANTIZATION_OVERSAMPLING[settings.QDRANT_QUANTIZATION]
+    )
+)
+
+@lru_cache(maxsize=64)
+def crawler_run_config(schema_json: str) -> CrawlerRunConfig:
+    """Build (once per distinct extraction schema) the crawl4ai run config"""
+    extract_schema = orjson.loads(schema_json)
+    return CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        extraction_strategy=JsonCssExtractionStrategy(extract_schema) if extract_schema else None
+    )
+
+@lru_cache(maxsize=1024)
+def payload_filter(conditions: Tuple[Tuple[str, Any], ...]) -> Optional[models.Filter]:
+    """
+    Build (once per distinct set of key/value matches) a Qdrant payload filter
+    
+    A tuple value matches any of its items; anything else must match exactly.
+    """
+    if not conditions:
+        return None
+    return models.Filter(must=[
+        models.FieldCondition(
+            key=key,
+            match=models.MatchAny(any=list(value)) if isinstance(value, tuple) else models.MatchValue(value=value)
+        )
+        for key, value in conditions
+    ])
+
+def unit_vectors(embeddings: List[List[float]]) -> np.ndarray:
+    """
+    Pack embeddings into one contiguous float32 array of unit-length rows
+    
+    Normalizing up front makes cosine similarity a plain dot product, both for
+    Qdrant and for the in-process query cache.
+    """
+    vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
 
 class AIOrchestrator:
     def __init__(self):
-        self.workflow = self._create_workflow()
         self.llm_router = self._setup_llm_router()
-        self.redis = Redis.from_params(
+        self.workflow = self._create_workflow()
+        self.redis = Redis(
             url=settings.REDIS_URL,
             token=settings.REDIS_TOKEN
         )
-        self.qdrant = QdrantClient(
+        # The async client is created in initialize(), inside the event loop
+        self.qdrant: Optional[AsyncQdrantClient] = None
+        self._query_cache = QueryResultCache(
+            dim=settings.EMBEDDING_DIM,
+            max_entries=QUERY_CACHE_SIZE,
+            min_similarity=QUERY_CACHE_MIN_SIMILARITY,
+            ttl_seconds=QUERY_CACHE_TTL
+        )
+        # Batching queues and their workers, started on first use (see _submit)
+        self._batch_queues: Dict[str, asyncio.Queue] = {}
+        self._batch_workers: List[asyncio.Task] = []
+        # Fire-and-forget work, referenced here so it isn't garbage collected
+        self._background_tasks: set = set()
+        # One browser shared by all crawls, launched on first use
+        self._browser_conf = BrowserConfig(
+            headless=True,
+            browser="chromium",
+            proxy=None,
+            timeout=settings.CRAWL4AI_TIMEOUT
+        )
+        self._crawler: Optional[AsyncWebCrawler] = None
+        self._crawler_lock: Optional[asyncio.Lock] = None
+        self._crawl_semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def initialize(self) -> None:
+        """Connect to Qdrant and make sure the collection exists"""
+        self.qdrant = AsyncQdrantClient(
             url=settings.QDRANT_URL,
-            api_key=settings.QDRANT_API_KEY
+            api_key=settings.QDRANT_API_KEY,
+            prefer_grpc=settings.QDRANT_PREFER_GRPC,
+            grpc_port=settings.QDRANT_GRPC_PORT
         )
-        self._init_qdrant_collection()
+        await self._init_qdrant_collection()
+        self._crawler_lock = asyncio.Lock()
+        self._crawl_semaphore = asyncio.Semaphore(settings.CRAWL4AI_MAX_CONCURRENCY)
     
-    def _init_qdrant_collection(self):
+    async def close(self) -> None:
+        """Stop the batching workers and close the Qdrant connection"""
+        # Let queued writes finish before their workers go away
+        if self._background_tasks:
+            await asyncio.wait(self._background_tasks, timeout=BACKGROUND_DRAIN_TIMEOUT)
+        for task in self._batch_workers:
+            task.cancel()
+        if self.qdrant is not None:
+            await self.qdrant.close()
+        if self._crawler is not None:
+            await self._crawler.close()
+    
+    async def _init_qdrant_collection(self):
         """Initialize Qdrant collection if it doesn't exist"""
         try:
-            collections = self.qdrant.get_collections()
+            collections = await self.qdrant.get_collections()
             collection_names = [c.name for c in collections.collections]
             
             if settings.QDRANT_COLLECTION not in collection_names:
-                self.qdrant.create_collection(
+                await self.qdrant.create_collection(
                     collection_name=settings.QDRANT_COLLECTION,
                     vectors_config={
                         "text": models.VectorParams(
-                            size=768,  # Adjust based on your embedding model
-                            distance=models.Distance.COSINE
+                            size=settings.EMBEDDING_DIM,
+                            distance=models.Distance.COSINE,
+                            # Full-precision vectors only serve rescoring, the
+                            # quantized copy kept in RAM drives the HNSW walk
+                            on_disk=True
                         )
-                    }
+                    },
+                    hnsw_config=models.HnswConfigDiff(m=24, ef_construct=128),
+                    quantization_config=QUANTIZATION_CONFIGS[settings.QDRANT_QUANTIZATION]
                 )
                 logger.info(f"Created Qdrant collection: {settings.QDRANT_COLLECTION}")
+            else:
+                # An existing collection built for another embedding size would
+                # reject (or silently mis-rank) every vector this process writes
+                info = await self.qdrant.get_collection(settings.QDRANT_COLLECTION)
+                vectors = info.config.params.vectors
+                params = vectors.get("text") if isinstance(vectors, dict) else vectors
+                size = params.size if params is not None else None
+                if size != settings.EMBEDDING_DIM:
+                    raise ValueError(
+                        f"Qdrant collection '{settings.QDRANT_COLLECTION}' stores {size}-dimensional "
+                        f"'text' vectors but EMBEDDING_DIM is {settings.EMBEDDING_DIM}"
+                    )
+            
+            # Index the payload fields search_similar filters on. A failure here
+            # only costs filtered-search speed, so it must not block startup.
+            for field_name in INDEXED_PAYLOAD_FIELDS:
+                try:
+                    await self.qdrant.create_payload_index(
+                        collection_name=settings.QDRANT_COLLECTION,
+                        field_name=field_name,
+                        field_schema=models.PayloadSchemaType.KEYWORD
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not create payload index on '{field_name}': {str(e)}")
         except Exception as e:
             logger.error(f"Error initializing Qdrant collection: {str(e)}")
             raise
     
+    def _run_in_background(self, coro: Awaitable[Any]) -> None:
+        """Schedule a coroutine without waiting for it"""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _submit(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        item: Any,
+        max_size: int,
+        max_wait: float
+    ) -> Any:
+        """
+        Queue an item for a batch handler and wait for its share of the result
+        
+        The handler receives every item collected within max_wait of the first
+        one (up to max_size) and returns one result per item, in order.
+        """
+        name = handler.__name__
+        if name not in self._batch_queues:
+            # Started lazily: the orchestrator is constructed outside the event loop
+            self._batch_queues[name] = asyncio.Queue()
+            self._batch_workers.append(asyncio.create_task(
+                self._batch_worker(self._batch_queues[name], handler, max_size, max_wait)
+            ))
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queues[name].put((item, future))
+        return await future
+    
+    async def _batch_worker(
+        self,
+        queue: asyncio.Queue,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_size: int,
+        max_wait: float
+    ) -> None:
+        """Drain a queue in batches and hand each caller its result"""
+        while True:
+            batch = await self._next_batch(queue, max_size, max_wait)
+            try:
+                results = await handler([item for item, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+    
+    @staticmethod
+    async def _next_batch(queue: asyncio.Queue, max_size: int, max_wait: float) -> List[Any]:
+        """Wait for one item, then collect more until the batch is full or max_wait elapses"""
+        loop = asyncio.get_running_loop()
+        batch = [await queue.get()]
+        deadline = loop.time() + max_wait
+        while len(batch) < max_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
     async def _get_cached_result(self, key: str) -> Optional[Any]:
         """Get cached result from Redis"""
         try:
-            cached = await self.redis.get(key)
-            return json.loads(cached) if cached else None
+            cached = await self._submit(self._read_cache_batch, key, CACHE_BATCH_SIZE, CACHE_BATCH_MAX_WAIT)
+            return orjson.loads(cached) if cached else None
         except Exception as e:
             logger.warning(f"Error getting cache: {str(e)}")
             return None
@@ -70,52 +334,70 @@ class AIOrchestrator:
     async def _set_cached_result(self, key: str, value: Any, ttl_seconds: int = 3600) -> None:
         """Cache result in Redis with TTL"""
         try:
-            await self.redis.setex(key, ttl_seconds, json.dumps(value))
+            await self._submit(
+                self._write_cache_batch,
+                (key, ttl_seconds + random.randint(0, int(ttl_seconds * CACHE_TTL_JITTER)), orjson.dumps(value).decode()),
+                CACHE_BATCH_SIZE,
+                CACHE_BATCH_MAX_WAIT
+            )
         except Exception as e:
             logger.warning(f"Error setting cache: {str(e)}")
     
+    async def _read_cache_batch(self, keys: List[str]) -> List[Optional[str]]:
+        """Fetch a batch of cache keys with a single MGET"""
+        unique_keys = list(dict.fromkeys(keys))
+        values = dict(zip(unique_keys, await self.redis.mget(*unique_keys)))
+        return [values[key] for key in keys]
+    
+    async def _write_cache_batch(self, entries: List[Tuple[str, int, str]]) -> List[None]:
+        """Write a batch of cache entries in one pipelined request"""
+        pipeline = self.redis.pipeline()
+        for key, ttl_seconds, value in entries:
+            pipeline.setex(key, ttl_seconds, value)
+        await pipeline.exec()
+        return [None] * len(entries)
+    
     def _generate_cache_key(self, prefix: str, **kwargs) -> str:
         """Generate a consistent cache key from parameters"""
-        key_str = "".join(f"{k}:{v}" for k, v in sorted(kwargs.items()))
-        return f"{prefix}:{hashlib.md5(key_str.encode()).hexdigest()}"
+        # Sorted at every level, so equal dicts hash alike whatever their key order
+        body = orjson.dumps(kwargs, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return f"{prefix}:{hashlib.blake2b(body, digest_size=16).hexdigest()}"
     
     async def crawl_website(self, url: str, extract_schema: Optional[Dict] = None) -> Dict[str, Any]:
         """Crawl a website and optionally extract structured data"""
-        cache_key = self._generate_cache_key("crawl", url=url, schema=json.dumps(extract_schema or {}))
+        schema_json = orjson.dumps(extract_schema or {}, option=orjson.OPT_SORT_KEYS).decode()
+        cache_key = self._generate_cache_key("crawl", url=url, schema=schema_json)
         
         # Check cache first
         if cached := await self._get_cached_result(cache_key):
-            logger.info(f"Cache hit for URL: {url}")
+            logger.info("Cache hit for URL: {}", url)
             return cached
         
-        browser_conf = BrowserConfig(
-            headless=True,
-            browser="chromium",
-            proxy=None,
-            timeout=30000  # 30 seconds
-        )
-        
-        run_conf = CrawlerRunConfig(
-            cache_mode=CacheMode.BYPASS,
-            extraction_strategy=JsonCssExtractionStrategy(extract_schema) if extract_schema else None
-        )
+        # Another caller may be crawling this URL already; use its result
+        lock_key = f"{cache_key}:lock"
+        lock_token = await self._acquire_lock(lock_key)
+        if lock_token is None and (cached := await self._wait_for_cached_result(cache_key, lock_key)):
+            logger.info("Cache hit for URL after waiting on another crawl: {}", url)
+            return cached
         
         try:
-            async with AsyncWebCrawler(config=browser_conf) as crawler:
-                result = await crawler.arun(url=url, config=run_conf)
-                
-                response = {
-                    "url": url,
-                    "markdown": result.markdown.raw_markdown if result.markdown else "",
-                    "extracted_data": json.loads(result.extracted_content) if result.extracted_content else {},
-                    "screenshot": result.screenshot if hasattr(result, 'screenshot') else None,
-                    "status": "success"
-                }
-                
-                # Cache the result
-                await self._set_cached_result(cache_key, response)
-                return response
-                
+            crawler = await self._get_crawler()
+            async with self._crawl_semaphore:
+                result = await crawler.arun(url=url, config=crawler_run_config(schema_json))
+            
+            response = {
+                "url": url,
+                "markdown": result.markdown.raw_markdown if result.markdown else "",
+                # Only a schema produces structured data worth parsing
+                "extracted_data": orjson.loads(result.extracted_content) if extract_schema and result.extracted_content else {},
+                "screenshot": getattr(result, "screenshot", None),
+                "status": "success"
+            }
+            
+            # Cache the result
+            await self._set_cached_result(cache_key, response)
+            return response
+            
         except Exception as e:
             logger.error(f"Error crawling {url}: {str(e)}")
             return {
@@ -123,6 +405,66 @@ class AIOrchestrator:
                 "error": str(e),
                 "status": "error"
             }
+        finally:
+            if lock_token is not None:
+                await self._release_lock(lock_key, lock_token)
+    
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """
+        Try to take a short-lived Redis lock (SET NX PX)
+        
+        Returns the token needed to release the lock, or None if another
+        caller holds it.
+        """
+        token = secrets.token_hex(16)
+        try:
+            acquired = await self.redis.set(key, token, nx=True, px=CRAWL_LOCK_TTL_MS)
+        except Exception as e:
+            # Without Redis nobody else can share a result, so don't wait on one
+            logger.warning(f"Error acquiring lock: {str(e)}")
+            return token
+        return token if acquired else None
+    
+    async def _release_lock(self, key: str, token: str) -> None:
+        """Release a lock taken with _acquire_lock, if it is still ours"""
+        try:
+            await self.redis.eval(RELEASE_LOCK_SCRIPT, keys=[key], args=[token])
+        except Exception as e:
+            logger.warning(f"Error releasing lock: {str(e)}")
+    
+    async def _wait_for_cached_result(self, key: str, lock_key: str) -> Optional[Any]:
+        """
+        Poll the cache with backoff while another caller holds lock_key
+        
+        Returns None once the lock is gone (or its TTL has passed) without a
+        cached result, e.g. because the holder's crawl failed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CRAWL_LOCK_TTL_MS / 1000
+        delay = 0.05
+        while loop.time() < deadline:
+            await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+            if cached := await self._get_cached_result(key):
+                return cached
+            try:
+                locked = await self.redis.exists(lock_key)
+            except Exception as e:
+                logger.warning(f"Error checking lock: {str(e)}")
+                return None
+            if not locked:
+                # The holder may have cached its result just before releasing
+                return await self._get_cached_result(key)
+            delay = min(delay * 2, CRAWL_LOCK_POLL_MAX)
+        return None
+    
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """Return the shared crawler, launching the browser on first use"""
+        async with self._crawler_lock:
+            if self._crawler is None:
+                crawler = AsyncWebCrawler(config=self._browser_conf)
+                await crawler.start()
+                self._crawler = crawler
+        return self._crawler
     
     async def store_embeddings(
         self, 
@@ -133,6 +475,9 @@ class AIOrchestrator:
         """
         Store text and its embeddings in Qdrant
         
+        The text is queued and embedded/upserted together with any other
+        documents stored within the same short window (see _store_embedding_batch).
+        
         Args:
             text: The text to embed and store
             metadata: Additional metadata to store with the text
@@ -141,42 +486,67 @@ class AIOrchestrator:
         Returns:
             bool: True if successful, False otherwise
         """
+        return await self._submit(
+            self._store_embedding_batch,
+            (text, metadata, collection_name),
+            EMBEDDING_BATCH_SIZE,
+            EMBEDDING_BATCH_MAX_WAIT
+        )
+    
+    async def _store_embedding_batch(
+        self,
+        batch: List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]
+    ) -> List[bool]:
+        """Embed a batch of texts with one call and upsert them with one request per collection"""
         try:
-            # Generate embeddings using our embedding utility
-            embeddings = await embedding_utils.get_embeddings([text])
-            if not embeddings or not embeddings[0]:
+            embeddings = await embedding_utils.get_embeddings([text for text, *_ in batch])
+            if not embeddings or len(embeddings) != len(batch):
                 logger.error("Failed to generate embeddings")
-                return False
-                
-            # Create a unique ID for the document
-            doc_id = hashlib.md5(text.encode()).hexdigest()
+                return [False] * len(batch)
             
-            # Prepare metadata
-            metadata = metadata or {}
-            metadata.update({
-                "text": text, 
-                "timestamp": datetime.utcnow().isoformat(),
-                "source": metadata.get("source", "unknown")
-            })
+            vectors = unit_vectors(embeddings)
+            timestamp = utcnow().isoformat()
+            points_by_collection: Dict[str, Dict[str, models.PointStruct]] = {}
+            for (text, metadata, collection_name), vector in zip(batch, vectors):
+                # Create a unique ID for the document (16 bytes, so a valid Qdrant UUID)
+                doc_id = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+                
+                # Prepare metadata
+                metadata = metadata or {}
+                metadata.update({
+                    "text": text[:TEXT_SNIPPET_LENGTH], 
+                    "timestamp": timestamp,
+                    "source": metadata.get("source", "unknown")
+                })
+                if len(text) > TEXT_SNIPPET_LENGTH:
+                    metadata["truncated"] = True
+                
+                # Keyed by doc_id so duplicates within a batch collapse to one point
+                collection = collection_name or settings.QDRANT_COLLECTION
+                points_by_collection.setdefault(collection, {})[doc_id] = models.PointStruct(
+                    id=doc_id,
+                    vector={"text": vector.tolist()},
+                    payload=metadata
+                )
             
             # Store in Qdrant
-            collection = collection_name or settings.QDRANT_COLLECTION
-            self.qdrant.upsert(
-                collection_name=collection,
-                points=[
-                    models.PointStruct(
-                        id=doc_id,
-                        vector={"text": embeddings[0]},
-                        payload=metadata
-                    )
-                ]
-            )
-            logger.info(f"Stored embeddings for document in collection '{collection}': {doc_id}")
-            return True
+            for collection, points in points_by_collection.items():
+                await self.qdrant.upsert(
+                    collection_name=collection,
+                    points=list(points.values()),
+                    # Wait until the points are searchable, so a search can't
+                    # re-cache results without them after the invalidation below
+                    wait=True
+                )
+                # Cached searches on this collection may now miss the new points
+                self._query_cache.invalidate(lambda key: key[0] == collection)
+                logger.info("Stored embeddings for {} documents in collection '{}'", len(points), collection)
+            
+            return [True] * len(batch)
             
         except Exception as e:
             logger.error(f"Error storing embeddings: {str(e)}")
-            return False
+            return [False] * len(batch)
     
     async def search_similar(
         self, 
@@ -189,86 +559,125 @@ class AIOrchestrator:
         """
         Search for similar content in Qdrant using vector similarity
         
+        Concurrent searches are embedded together and sent to Qdrant as a
+        single search_batch request (see _search_batch).
+        
         Args:
             query: The query text to find similar content for
             limit: Maximum number of results to return
             collection_name: Optional collection name (defaults to settings.QDRANT_COLLECTION)
             score_threshold: Minimum similarity score (0-1) for results
-            metadata_filters: Optional metadata filters to apply to the search
+            metadata_filters: Optional metadata filters to apply to the search;
+                a list value matches payloads with any of the listed values
             
         Returns:
             List of similar documents with scores and metadata
         """
+        # Prepare filters (hashable, so the filter and results can be cached)
+        conditions = tuple(sorted(
+            (key, tuple(value) if isinstance(value, (list, tuple)) else value)
+            for key, value in (metadata_filters or {}).items()
+        ))
+        request = {
+            "limit": limit,
+            "score_threshold": score_threshold,
+            "filter": payload_filter(conditions)
+        }
+        
+        # Results can only be reused for the same collection and search parameters
+        collection = collection_name or settings.QDRANT_COLLECTION
+        cache_key = (collection, limit, score_threshold, conditions)
+        
+        results = await self._submit(
+            self._search_batch,
+            (query, collection, request, cache_key),
+            SEARCH_BATCH_SIZE,
+            SEARCH_BATCH_MAX_WAIT
+        )
+        logger.info("Found {} similar documents for query: {:.50}...", len(results), query)
+        return results
+    
+    async def _search_batch(
+        self,
+        batch: List[Tuple[str, str, Dict[str, Any], Tuple]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Embed a batch of queries with one call and search them with one request per collection"""
+        results: List[List[Dict[str, Any]]] = [[] for _ in batch]
         try:
-            # Generate query embedding
-            query_embedding = await embedding_utils.get_embeddings([query])
-            if not query_embedding or not query_embedding[0]:
+            # Generate query embeddings
+            query_embeddings = await embedding_utils.get_embeddings([query for query, *_ in batch])
+            if not query_embeddings or len(query_embeddings) != len(batch):
                 logger.error("Failed to generate query embedding")
-                return []
-                
-            # Prepare filters
-            filter_conditions = []
-            if metadata_filters:
-                for key, value in metadata_filters.items():
-                    filter_conditions.append(models.FieldCondition(
-                        key=f"metadata.{key}",
-                        match=models.MatchValue(value=value)
-                    ))
-            
-            # Build the query filter
-            query_filter = models.Filter(
-                must=filter_conditions if filter_conditions else None
-            )
-            
-            # Search in Qdrant
-            collection = collection_name or settings.QDRANT_COLLECTION
-            search_result = self.qdrant.search(
-                collection_name=collection,
-                query_vector=("text", query_embedding[0]),
-                query_filter=query_filter if filter_conditions else None,
-                limit=limit,
-                score_threshold=score_threshold
-            )
+                return results
+            query_vectors = unit_vectors(query_embeddings)
             
-            # Format results
-            results = []
-            for hit in search_result:
-                payload = hit.payload or {}
-                results.append({
-                    "id": hit.id,
-                    "score": hit.score,
-                    "payload": payload,
-                    "text": payload.get("text", "")[:500] + ("..." if len(payload.get("text", "")) > 500 else ""),
-                    "metadata": {
-                        k: v for k, v in payload.items() 
-                        if k not in ["text", "vector"]
-                    }
-                })
+            # Each request keeps its own limit/threshold/filter, so grouping by
+            # collection is enough to share one round trip
+            positions_by_collection: Dict[str, List[int]] = {}
+            for position, (_, collection, _, cache_key) in enumerate(batch):
+                cached = self._query_cache.get(cache_key, query_vectors[position])
+                if cached is not None:
+                    results[position] = list(cached)
+                    continue
+                positions_by_collection.setdefault(collection, []).append(position)
             
-            logger.info(f"Found {len(results)} similar documents for query: {query[:50]}...")
-            return results
+            for collection, positions in positions_by_collection.items():
+                search_results = await self.qdrant.search_batch(
+                    collection_name=collection,
+                    requests=[
+                        models.SearchRequest(
+                            vector=models.NamedVector(name="text", vector=query_vectors[position].tolist()),
+                            with_payload=True,
+                            params=SEARCH_PARAMS,
+                            **batch[position][2]
+                        )
+                        for position in positions
+                    ]
+                )
+                for position, hits in zip(positions, search_results):
+                    results[position] = [self._format_hit(hit) for hit in hits]
+                    self._query_cache.put(batch[position][3], query_vectors[position], results[position])
             
         except Exception as e:
             logger.error(f"Error searching similar content: {str(e)}")
-            return []
+        return results
+    
+    @staticmethod
+    def _format_hit(hit: models.ScoredPoint) -> Dict[str, Any]:
+        """Shape a Qdrant hit into the search_similar result format"""
+        payload = hit.payload or {}
+        text = payload.get("text", "")
+        truncated = payload.get("truncated", False) or len(text) > TEXT_SNIPPET_LENGTH
+        return {
+            "id": hit.id,
+            "score": hit.score,
+            "payload": payload,
+            "text": text[:TEXT_SNIPPET_LENGTH] + ("..." if truncated else ""),
+            "metadata": {
+                k: v for k, v in payload.items() 
+                if k not in ["text", "truncated", "vector"]
+            }
+        }
     
     async def process_message(self, message: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Process a user message through the AI workflow with enhanced capabilities"""
         try:
-            # Check if message contains a URL and needs web crawling
-            urls = self._extract_urls(message)
+            # Check if message contains a URL and needs web crawling; a URL
+            # pasted twice is crawled once
+            urls = list(dict.fromkeys(self._extract_urls(message)))
             crawled_data = {}
             
             if urls:
-                for url in urls:
-                    # Use a simple schema for news/article sites
-                    schema = {
-                        "title": "h1",
-                        "content": ["article", ".content"],
-                        "author": ["[itemprop='author']", ".author"],
-                        "date": ["[itemprop='datePublished']", "time", ".date"]
-                    }
-                    crawled_data[url] = await self.crawl_website(url, schema)
+                # One failed crawl shouldn't discard the pages that loaded
+                results = await asyncio.gather(
+                    *(self.crawl_website(url, ARTICLE_SCHEMA) for url in urls),
+                    return_exceptions=True
+                )
+                crawled_data = {
+                    url: {"url": url, "error": str(result), "status": "error"}
+                    if isinstance(result, BaseException) else result
+                    for url, result in zip(urls, results)
+                }
             
             # Initialize state with crawled data
             state = {
@@ -276,26 +685,26 @@ class AIOrchestrator:
                 "context": {
                     **context,
                     "crawled_data": crawled_data,
-                    "crawl_timestamp": datetime.utcnow().isoformat()
+                    "crawl_timestamp": utcnow().isoformat()
                 },
                 "intermediate_steps": [],
                 "final_output": None
             }
             
             # Execute workflow
-            for node in self.workflow:
-                state = await node.process(state, self.llm_router)
+            state = await self.workflow.ainvoke(state)
             
-            # Store conversation in vector DB for future reference
+            # Store conversation in vector DB for future reference, without
+            # holding the response until the batch is flushed
             if state.get("final_output"):
-                await self.store_embeddings(
+                self._run_in_background(self.store_embeddings(
                     text=message,
                     metadata={
                         "response": state["final_output"],
                         "context": context,
                         "type": "conversation"
                     }
-                )
+                ))
             
             return {
                 "response": state["final_output"], 
@@ -309,9 +718,11 @@ class AIOrchestrator:
     
     def _extract_urls(self, text: str) -> List[str]:
         """Extract URLs from text"""
-        import re
-        url_pattern = r'https?://[^\s<>"]+|www\.[^\s<>"]+'
-        return re.findall(url_pattern, text)
+        # Most messages have no URL; plain substring checks rule that out
+        # faster than a regex scan
+        if "http" not in text and "www." not in text:
+            return []
+        return URL_PATTERN.findall(text)
     
     def _extract_sources(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract sources from the workflow state"""
@@ -339,15 +750,40 @@ class AIOrchestrator:
         
         return sources
 
-    def _create_workflow(self) -> List['BaseNode']:
-        """Create and return the workflow nodes"""
-        return [
-            IntentClassifierNode(),
-            KnowledgeRetrievalNode(),
-            TaskPlannerNode(),
-            CrewExecutorNode(),
-            ResponseGeneratorNode()
-        ]
+    def _create_workflow(self):
+        """Compile the workflow nodes into a LangGraph state graph"""
+        graph = StateGraph(WorkflowState)
+        # Intent classification and knowledge retrieval only read the message,
+        # so they run concurrently as one step
+        graph.add_node("understand", self._graph_node(IntentClassifierNode(), KnowledgeRetrievalNode()))
+        graph.add_node("plan", self._graph_node(TaskPlannerNode()))
+        graph.add_node("execute", self._graph_node(CrewExecutorNode()))
+        graph.add_node("respond", self._graph_node(ResponseGeneratorNode()))
+        
+        graph.set_entry_point("understand")
+        graph.add_edge("understand", "plan")
+        graph.add_edge("plan", "execute")
+        graph.add_edge("execute", "respond")
+        graph.set_finish_point("respond")
+        return graph.compile()
+    
+    def _graph_node(self, *nodes: 'BaseNode') -> Callable[[Dict], Awaitable[Dict]]:
+        """
+        Adapt workflow nodes to a graph step
+        
+        Nodes are run concurrently on their own copy of the state and only the
+        keys they changed are returned, since a graph step must emit an update
+        rather than the whole state.
+        """
+        async def run(state: Dict) -> Dict:
+            async def update(node: 'BaseNode') -> Dict:
+                result = await node.process(dict(state), self.llm_router)
+                return {k: v for k, v in result.items() if k not in state or state[k] is not v}
+            
+            updates = await asyncio.gather(*(update(node) for node in nodes))
+            return {k: v for changes in updates for k, v in changes.items()}
+        
+        return run
     
     def _setup_llm_router(self):
         """Initialize LLM router for different tasks"""
@@ -358,23 +794,41 @@ class AIOrchestrator:
             "default": {"model": "gpt-4", "provider": "openai"}
         }
 
+class WorkflowState(TypedDict, total=False):
+    messages: List[Dict[str, Any]]
+    context: Dict[str, Any]
+    intermediate_steps: List[Any]
+    final_output: Optional[Dict[str, Any]]
+    intent: str
+    retrieved_knowledge: List[Any]
+    tasks: List[Dict[str, Any]]
+
 class BaseNode:
     async def process(self, state: Dict, llm_router: Dict) -> Dict:
         raise NotImplementedError("Subclasses must implement process method")
 
+# Keyword patterns per intent, checked in priority order. Each is one
+# compiled alternation, so a message is scanned once per intent rather
+# than once per keyword.
+INTENT_PATTERNS = [
+    (intent, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for intent, keywords in (
+        ("analysis", ["analyze", "analysis", "understand", "explain"]),
+        ("programming", ["code", "program", "script", "function"]),
+    )
+]
+
 class IntentClassifierNode(BaseNode):
     async def process(self, state: Dict, llm_router: Dict) -> Dict:
         logger.info("Classifying intent...")
-        message = state["messages"][-1]["content"].lower()
+        message = state["messages"][-1]["content"]
         
-        if any(word in message for word in ["analyze", "analysis", "understand", "explain"]):
-            state["intent"] = "analysis"
-        elif any(word in message for word in ["code", "program", "script", "function"]):
-            state["intent"] = "programming"
-        else:
-            state["intent"] = "general"
+        state["intent"] = next(
+            (intent for intent, pattern in INTENT_PATTERNS if pattern.search(message)),
+            "general"
+        )
             
-        logger.info(f"Classified intent: {state['intent']}")
+        logger.info("Classified intent: {}", state["intent"])
         return state
 
 class KnowledgeRetrievalNode(BaseNode):
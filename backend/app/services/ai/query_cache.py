@@ -0,0 +1,74 @@
+import time
+from typing import Any, Callable, Hashable, List, Optional
+
+import numpy as np
+
+
+class QueryResultCache:
+    """
+    Recent similarity-search results, looked up by query embedding
+
+    Entries live in a fixed-size ring buffer. A lookup scores the query against
+    every cached embedding with a single matrix-vector product, which for a few
+    thousand vectors takes well under a millisecond, so no ANN index is needed.
+    A hit requires the same search parameters (key) and a cosine similarity of
+    at least min_similarity, i.e. the same question, possibly reworded.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        max_entries: int = 4096,
+        min_similarity: float = 0.98,
+        ttl_seconds: float = 300.0
+    ):
+        self.dim = dim
+        self.min_similarity = min_similarity
+        self.ttl_seconds = ttl_seconds
+        self._vectors = np.zeros((max_entries, dim), dtype=np.float32)
+        self._expires = np.zeros(max_entries)  # 0 marks an empty slot
+        self._keys: List[Optional[Hashable]] = [None] * max_entries
+        self._results: List[Any] = [None] * max_entries
+        self._next = 0
+
+    def get(self, key: Hashable, embedding: List[float]) -> Optional[Any]:
+        """Return the results cached for a near-identical query, if any"""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+
+        scores = self._vectors @ vector
+        scores[self._expires <= time.monotonic()] = -np.inf
+        for slot in np.flatnonzero(scores >= self.min_similarity):
+            if self._keys[slot] == key:
+                return self._results[slot]
+        return None
+
+    def put(self, key: Hashable, embedding: List[float], results: Any) -> None:
+        """Cache results for a query, replacing the oldest entry when full"""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        slot = self._next
+        self._vectors[slot] = vector
+        self._expires[slot] = time.monotonic() + self.ttl_seconds
+        self._keys[slot] = key
+        self._results[slot] = results
+        self._next = (slot + 1) % len(self._keys)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches predicate, e.g. after its data changed"""
+        for slot, key in enumerate(self._keys):
+            if key is not None and predicate(key):
+                self._keys[slot] = None
+                self._results[slot] = None
+                self._expires[slot] = 0
+    
+    def _normalize(self, embedding: List[float]) -> Optional[np.ndarray]:
+        """Unit-normalize an embedding, or None if it can't be compared"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if vector.shape != (self.dim,) or norm == 0:
+            return None
+        return vector / norm
@@ -0,0 +1,4 @@
+from .ids import new_ids
+from .time import utcnow
+
+__all__ = ["new_ids", "utcnow"]
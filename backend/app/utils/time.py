@@ -0,0 +1,13 @@
+from datetime import datetime, timezone
+
+def utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime.
+
+    Replaces the deprecated, naive ``datetime.utcnow()`` so every timestamp
+    the app produces carries its UTC offset.
+    """
+    return datetime.now(timezone.utc)
+
+def iso_from_ns(timestamp_ns: int) -> str:
+    """Format a ``time.time_ns()`` reading as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
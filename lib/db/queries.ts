@@ -49,7 +49,7 @@ export async function getUser(email: string): Promise<Array<User>> {
 }
 
 export async function createUser(email: string, password: string) {
-  const hashedPassword = generateHashedPassword(password);
+  const hashedPassword = await generateHashedPassword(password);
 
   try {
     return await db.insert(user).values({ email, password: hashedPassword });
@@ -61,7 +61,7 @@ export async function createUser(email: string, password: string) {
 
 export async function createGuestUser() {
   const email = `guest-${Date.now()}`;
-  const password = generateHashedPassword(generateUUID());
+  const password = await generateHashedPassword(generateUUID());
 
   try {
     return await db.insert(user).values({ email, password }).returning({
@@ -1,16 +1,21 @@
 import { generateId } from 'ai';
-import { genSaltSync, hashSync } from 'bcrypt-ts';
+import { genSalt, genSaltSync, hash, hashSync } from 'bcrypt-ts';
 
-export function generateHashedPassword(password: string) {
-  const salt = genSaltSync(10);
-  const hash = hashSync(password, salt);
+const SALT_ROUNDS = 10;
 
-  return hash;
+// Async hashing works in chunks, so a signup doesn't block the event loop
+// for the whole bcrypt computation
+export async function generateHashedPassword(password: string) {
+  const salt = await genSalt(SALT_ROUNDS);
+  const hashedPassword = await hash(password, salt);
+
+  return hashedPassword;
 }
 
 export function generateDummyPassword() {
   const password = generateId(12);
-  const hashedPassword = generateHashedPassword(password);
+  const salt = genSaltSync(SALT_ROUNDS);
+  const hashedPassword = hashSync(password, salt);
 
   return hashedPassword;
 }